@@ -7,7 +7,41 @@ let autoSlideInterval;
 let isAutoSlideStopped = false;
 let isMouseHovering = false;
 
+let preloadTimer;
+
+// Swap deferred data-src/data-srcset attributes in so the browser fetches the slide
+function loadSlideMedia(index) {
+    let slide = slides[(index + slides.length) % slides.length];
+    if (!slide || slide.dataset.loaded) {
+        return;
+    }
+    slide.dataset.loaded = "true";
+
+    slide.querySelectorAll("[data-srcset]").forEach(el => {
+        el.srcset = el.dataset.srcset;
+        el.removeAttribute("data-srcset");
+    });
+    slide.querySelectorAll("[data-src]").forEach(el => {
+        el.src = el.dataset.src;
+        el.removeAttribute("data-src");
+    });
+    slide.querySelectorAll("[data-poster]").forEach(el => {
+        el.poster = el.dataset.poster;
+        el.removeAttribute("data-poster");
+    });
+
+    let video = slide.querySelector("video");
+    if (video) {
+        video.load(); // preload="none" keeps this from downloading until play
+    }
+}
+
 function showSlide(index) {
+    loadSlideMedia(index);
+    // Fetch the upcoming slide well before the next 5 second auto-advance
+    clearTimeout(preloadTimer);
+    preloadTimer = setTimeout(() => loadSlideMedia(index + 1), 2000);
+
     slides.forEach((slide, idx) => {
         if (idx === index) {
             slide.classList.add("show");
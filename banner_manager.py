@@ -1,12 +1,473 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from PIL import Image, ImageTk
+from PIL import Image, ImageOps, ImageTk, features
 import os
 import shutil
 import re
+import subprocess
+import hashlib
+import html
+import queue
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from bs4 import BeautifulSoup, Comment
+from image_optimizer import optimized_sources, rewrite_html
+from link_checker import new_broken_links
+from site_build import run_site_build, write_page
+from site_publish import READABLE_HTML, load_json, minify_html, save_json
 
 HTML_FILE = "banner.html"
+MANIFEST_FILE = "banner/banner.json"
+MANIFEST_VERSION = 1
 MEDIA_FOLDER = "banner/banner_img"
+CACHE_FOLDER = ".banner_cache"
+PREVIEW_CACHE_FOLDER = os.path.join(CACHE_FOLDER, "previews")
+PREVIEW_SIZE = (800, 450)
+PREVIEW_MEMORY_SLOTS = 40
+PREFETCH_POLL_MS = 40
+THUMB_CACHE_FOLDER = os.path.join(CACHE_FOLDER, "thumbs")
+THUMB_SIZE = (128, 72)
+FILMSTRIP_CELL = THUMB_SIZE[0] + 12
+THUMB_POLL_MS = 100
+VARIANT_FOLDER = os.path.join(MEDIA_FOLDER, "variants")
+VARIANT_WIDTHS = (360, 720, 1080, 1440)
+VARIANT_FALLBACK_WIDTH = 720
+VARIANT_SIZES = "(max-width: 722px) 100vw, 720px"
+WEBP_SUPPORTED = features.check("webp")
+POSTER_FOLDER = os.path.join(MEDIA_FOLDER, "posters")
+MEDIA_HASH_CACHE = os.path.join(CACHE_FOLDER, "media-hashes.json")
+COPY_CHUNK_SIZE = 1 << 20
+INGEST_POLL_MS = 50
+MAX_BANNER_EDGE = 1920
+
+
+# ---------------------------------------------------
+# PREVIEW DECODING (disk cache)
+# ---------------------------------------------------
+def preview_cache_path(file_path, size, folder=PREVIEW_CACHE_FOLDER):
+    stat = os.stat(file_path)
+    key = f"{os.path.abspath(file_path)}|{stat.st_mtime_ns}|{stat.st_size}|{size[0]}x{size[1]}"
+    return os.path.join(folder, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".jpg")
+
+
+def load_preview_image(file_path, size=PREVIEW_SIZE, folder=PREVIEW_CACHE_FOLDER):
+    """Return a PIL image scaled to `size`, from the disk cache when possible.
+
+    Safe to call off the Tk thread: it never touches Tk objects.
+    """
+    cache_path = preview_cache_path(file_path, size, folder)
+
+    if os.path.exists(cache_path):
+        try:
+            img = Image.open(cache_path)
+            img.load()
+            return img
+        except OSError:
+            pass
+
+    img = Image.open(file_path)
+    # For JPEGs, let the decoder skip straight to the smallest scale >= size
+    img.draft("RGB", size)
+    img = img.convert("RGB").resize(size, Image.LANCZOS)
+
+    os.makedirs(folder, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        img.save(tmp_path, "JPEG", quality=90)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Preview cache write failed: {e}")
+    return img
+
+
+def build_thumbnail(file_path):
+    """Process-pool worker: make sure the filmstrip thumbnail is on disk and return its path"""
+    load_preview_image(file_path, THUMB_SIZE, THUMB_CACHE_FOLDER)
+    return preview_cache_path(file_path, THUMB_SIZE, THUMB_CACHE_FOLDER)
+
+
+# ---------------------------------------------------
+# RESPONSIVE VARIANTS (publish time)
+# ---------------------------------------------------
+def file_sha256(file_path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def media_url(path):
+    return "./" + path.replace("\\", "/")
+
+
+def build_variants(file_path, sha256=None):
+    """Process-pool worker: write resized JPEG (and WebP) copies of one slide image.
+
+    Outputs are named after the source hash (pass it as `sha256` when it is
+    known already), so an unchanged image is never decoded again. Returns
+    the intrinsic size and the (width, path) lists.
+    """
+    digest = (sha256 or file_sha256(file_path))[:12]
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+
+    with Image.open(file_path) as probe:
+        width, height = probe.size
+        if probe.getexif().get(0x0112, 1) in (5, 6, 7, 8):
+            width, height = height, width
+
+    widths = [w for w in VARIANT_WIDTHS if w < width] + [min(width, VARIANT_WIDTHS[-1])]
+    formats = [("jpeg", ".jpg")] + ([("webp", ".webp")] if WEBP_SUPPORTED else [])
+    result = {"width": width, "height": height, "jpeg": [], "webp": []}
+
+    img = None
+    for fmt, ext in formats:
+        for w in sorted(set(widths)):
+            out_path = os.path.join(VARIANT_FOLDER, f"{stem}-{digest}-{w}{ext}")
+            if not os.path.exists(out_path):
+                if img is None:
+                    img = ImageOps.exif_transpose(Image.open(file_path)).convert("RGB")
+                h = max(1, round(height * w / width))
+                os.makedirs(VARIANT_FOLDER, exist_ok=True)
+                tmp_path = f"{out_path}.{os.getpid()}.tmp"
+                if fmt == "jpeg":
+                    img.resize((w, h), Image.LANCZOS).save(
+                        tmp_path, "JPEG", quality=82, optimize=True, progressive=True)
+                else:
+                    img.resize((w, h), Image.LANCZOS).save(tmp_path, "WEBP", quality=80, method=4)
+                os.replace(tmp_path, out_path)
+            result[fmt].append((w, out_path))
+    return result
+
+
+def picture_markup(variants, alt, lazy=False):
+    # Lazy slides carry data-src/data-srcset; script_banner.js swaps them in just in time
+    prefix = "data-" if lazy else ""
+    srcset = lambda items: ", ".join(f"{media_url(p)} {w}w" for w, p in items)
+    fallback = min(variants["jpeg"], key=lambda item: abs(item[0] - VARIANT_FALLBACK_WIDTH))[1]
+    markup = "        <picture>\n"
+    if variants["webp"]:
+        markup += f'            <source type="image/webp" {prefix}srcset="{srcset(variants["webp"])}" sizes="{VARIANT_SIZES}">\n'
+    markup += (f'            <img {prefix}src="{media_url(fallback)}" {prefix}srcset="{srcset(variants["jpeg"])}" '
+               f'sizes="{VARIANT_SIZES}" width="{variants["width"]}" height="{variants["height"]}" '
+               f'alt="{html.escape(alt, quote=True)}" />\n')
+    markup += "        </picture>\n"
+    return markup
+
+
+# ---------------------------------------------------
+# BANNER MANIFEST (banner.json is the source of truth)
+# ---------------------------------------------------
+def load_manifest(path=MANIFEST_FILE):
+    """Return (enabled, slides) from banner.json"""
+    data = load_json(path, {})
+    slides = []
+    for entry in data.get("slides", []):
+        if entry.get("file") and entry.get("type") in ("image", "video"):
+            slides.append({
+                "type": entry["type"],
+                "file": entry["file"],
+                "caption": entry.get("caption", ""),
+                "poster": entry.get("poster", ""),
+                "sha256": entry.get("sha256"),
+                "width": entry.get("width"),
+                "height": entry.get("height"),
+            })
+    return data.get("enabled", True), slides
+
+
+def save_manifest(enabled, slides, path=MANIFEST_FILE):
+    save_json(path, {
+        "version": MANIFEST_VERSION,
+        "enabled": enabled,
+        "slides": [{
+            "type": slide["type"],
+            "file": slide["file"],
+            "caption": slide["caption"],
+            "poster": slide.get("poster", ""),
+            "sha256": slide.get("sha256"),
+            "width": slide.get("width"),
+            "height": slide.get("height"),
+        } for slide in slides],
+    })
+
+
+def banner_media_file(url):
+    prefix = "./banner/banner_img/"
+    return url[len(prefix):] if url and url.startswith(prefix) else ""
+
+
+def import_banner_html(path=HTML_FILE):
+    """One-time import of a hand-written or previously generated banner.html.
+
+    Returns (enabled, slides). Captions come back unescaped, so quotes and
+    ampersands survive the round trip through the manifest.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    soup = BeautifulSoup(content, "html.parser")
+    enabled = True
+    # A disabled banner is the whole block wrapped in a comment
+    for comment in soup.find_all(string=lambda s: isinstance(s, Comment)):
+        if comment.strip().startswith("Banner Disabled"):
+            enabled = False
+            soup = BeautifulSoup(str(comment), "html.parser")
+            break
+
+    slides = []
+    for block in soup.select("div.slide"):
+        video = block.find("video")
+        link = block.find("a", attrs={"download": True})
+        caption = block.find("p")
+        caption = caption.get_text() if caption else ""
+
+        if video is not None:
+            source = video.find("source")
+            url = source.get("src") or source.get("data-src") if source else ""
+            slide = {
+                "type": "video",
+                "file": link["download"] if link else banner_media_file(url),
+                "caption": caption,
+                "poster": banner_media_file(video.get("poster") or video.get("data-poster")),
+            }
+        elif block.find("img") is not None:
+            img = block.find("img")
+            # The download link always names the original; <img> may point at a variant
+            slide = {
+                "type": "image",
+                "file": link["download"] if link else banner_media_file(
+                    img.get("src") or img.get("data-src")),
+                # generate_html wraps image captions in quotation marks
+                "caption": caption[1:-1] if len(caption) > 1 and caption[0] == caption[-1] == '"' else caption,
+                "poster": "",
+            }
+        else:
+            continue
+
+        if slide["file"]:
+            slides.append(slide)
+    return enabled, slides
+
+
+# ---------------------------------------------------
+# MEDIA INGEST (content-addressed)
+# ---------------------------------------------------
+def safe_media_name(filename):
+    stem, ext = os.path.splitext(os.path.basename(filename))
+    stem = re.sub(r"[^\w.-]+", "-", stem).strip(".-") or "media"
+    return stem + ext.lower()
+
+
+def unique_media_name(filename):
+    name = safe_media_name(filename)
+    stem, ext = os.path.splitext(name)
+    counter = 1
+    while os.path.exists(os.path.join(MEDIA_FOLDER, name)):
+        name = f"{stem}-{counter}{ext}"
+        counter += 1
+    return name
+
+
+def media_digests():
+    """Map file name -> sha256 for the media library, re-hashing only files whose stat changed"""
+    cache = load_json(MEDIA_HASH_CACHE, {})
+    fresh = {}
+
+    for entry in os.scandir(MEDIA_FOLDER):
+        if not entry.is_file() or entry.name.startswith("."):
+            continue
+        stat = entry.stat()
+        cached = cache.get(entry.name)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            digest = cached[2]
+        else:
+            digest = file_sha256(entry.path)
+        fresh[entry.name] = [stat.st_mtime_ns, stat.st_size, digest]
+
+    if fresh != cache:
+        save_json(MEDIA_HASH_CACHE, fresh)
+    return {name: cached[2] for name, cached in fresh.items()}
+
+
+def media_hashes():
+    """Map sha256 -> file name for the media library"""
+    by_hash = {}
+    for name, digest in media_digests().items():
+        by_hash.setdefault(digest, name)
+    return by_hash
+
+
+def stream_copy(src_path, dst_path, progress=None):
+    """Copy in chunks, returning the sha256 of what was written"""
+    total = os.path.getsize(src_path)
+    digest = hashlib.sha256()
+    copied = 0
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        for chunk in iter(lambda: src.read(COPY_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            dst.write(chunk)
+            copied += len(chunk)
+            if progress:
+                progress(copied, total)
+    return digest.hexdigest()
+
+
+def prepare_media(src_path, progress=None):
+    """Stage one file in MEDIA_FOLDER under a temporary name.
+
+    Images that need an orientation fix or are larger than MAX_BANNER_EDGE
+    are transposed, downscaled and recompressed; everything else is streamed
+    across unchanged. Safe to run in a worker process. Returns
+    (temporary path, sha256 of the staged file).
+    """
+    tmp_path = os.path.join(MEDIA_FOLDER, f".ingest-{uuid.uuid4().hex}.tmp")
+    ext = os.path.splitext(src_path)[1].lower()
+
+    try:
+        if ext != ".mp4":
+            with Image.open(src_path) as img:
+                rotated = img.getexif().get(0x0112, 1) != 1
+                oversized = max(img.size) > MAX_BANNER_EDGE
+                if rotated or oversized:
+                    img = ImageOps.exif_transpose(img)
+                    img.thumbnail((MAX_BANNER_EDGE, MAX_BANNER_EDGE), Image.LANCZOS)
+                    if ext == ".png":
+                        img.save(tmp_path, "PNG", optimize=True)
+                    else:
+                        img.convert("RGB").save(
+                            tmp_path, "JPEG", quality=85, optimize=True, progressive=True)
+                    return tmp_path, file_sha256(tmp_path)
+
+        return tmp_path, stream_copy(src_path, tmp_path, progress)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def store_media(tmp_path, sha256, src_path, known):
+    """Move a staged file into the library, or drop it if `known` already has that content.
+
+    Returns (file name, reused) and records new content in `known`.
+    """
+    if sha256 in known:
+        os.remove(tmp_path)
+        return known[sha256], True
+
+    name = unique_media_name(src_path)
+    os.replace(tmp_path, os.path.join(MEDIA_FOLDER, name))
+    known[sha256] = name
+    return name, False
+
+
+def ingest_media(src_path, progress=None):
+    """Bring one file into MEDIA_FOLDER keyed by content.
+
+    Identical content already in the library is reused instead of copied
+    again; a name taken by different content gets a numbered name.
+    Returns (file name, sha256, reused). `progress(done, total)` is called
+    after every copied chunk, from whatever thread runs the copy.
+    """
+    tmp_path, sha256 = prepare_media(src_path, progress)
+    name, reused = store_media(tmp_path, sha256, src_path, media_hashes())
+    return name, sha256, reused
+
+
+# ---------------------------------------------------
+# VIDEO POSTERS
+# ---------------------------------------------------
+def poster_file_for(video_file):
+    """Poster location for a video, relative to MEDIA_FOLDER"""
+    stem = os.path.splitext(os.path.basename(video_file))[0]
+    return f"posters/{stem}.jpg"
+
+
+def ffmpeg_poster(video_path, poster_path):
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        return False
+    result = subprocess.run(
+        [ffmpeg, "-y", "-loglevel", "error", "-ss", "1", "-i", video_path,
+         "-frames:v", "1", "-q:v", "3", poster_path],
+        capture_output=True, timeout=120)
+    return result.returncode == 0 and os.path.exists(poster_path)
+
+
+# Tried in order; each takes (video_path, poster_path) and returns True once
+# the poster JPEG has been written. Append to plug in another extractor.
+POSTER_EXTRACTORS = [ffmpeg_poster]
+
+
+def extract_poster(video_file):
+    """Return the poster (relative to MEDIA_FOLDER) for a video, extracting it if needed"""
+    video_path = os.path.join(MEDIA_FOLDER, video_file)
+    poster_file = poster_file_for(video_file)
+    poster_path = os.path.join(MEDIA_FOLDER, poster_file)
+
+    if os.path.exists(poster_path) and (
+            not os.path.exists(video_path)
+            or os.path.getmtime(poster_path) >= os.path.getmtime(video_path)):
+        return poster_file
+    if not os.path.exists(video_path):
+        return None
+
+    os.makedirs(POSTER_FOLDER, exist_ok=True)
+    for extractor in POSTER_EXTRACTORS:
+        try:
+            if extractor(video_path, poster_path):
+                return poster_file
+        except Exception as e:
+            print(f"Poster extractor {extractor.__name__} failed: {e}")
+    return None
+
+
+def save_user_poster(video_file, image_path):
+    """Store a user-chosen image as the video's poster"""
+    poster_file = poster_file_for(video_file)
+    os.makedirs(POSTER_FOLDER, exist_ok=True)
+    img = ImageOps.exif_transpose(Image.open(image_path)).convert("RGB")
+    img.thumbnail((VARIANT_WIDTHS[-1], VARIANT_WIDTHS[-1]), Image.LANCZOS)
+    img.save(os.path.join(MEDIA_FOLDER, poster_file), "JPEG", quality=85, optimize=True)
+    return poster_file
+
+
+# ---------------------------------------------------
+# PREVIEW CACHE (in-memory PhotoImages)
+# ---------------------------------------------------
+class PreviewCache:
+
+    def __init__(self, slots=PREVIEW_MEMORY_SLOTS, size=PREVIEW_SIZE):
+        self.slots = slots
+        self.size = size
+        self.images = OrderedDict()
+
+    def key(self, file_path):
+        stat = os.stat(file_path)
+        return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+    def peek(self, file_path):
+        key = self.key(file_path)
+        photo = self.images.get(key)
+        if photo is not None:
+            self.images.move_to_end(key)
+        return photo
+
+    def get(self, file_path):
+        photo = self.peek(file_path)
+        if photo is not None:
+            return photo
+        return self.put(self.key(file_path), load_preview_image(file_path, self.size))
+
+    def put(self, key, img):
+        photo = ImageTk.PhotoImage(img)
+        self.images[key] = photo
+        self.images.move_to_end(key)
+        while len(self.images) > self.slots:
+            self.images.popitem(last=False)
+        return photo
 
 
 class BannerManager:
@@ -14,66 +475,60 @@ class BannerManager:
     def __init__(self, root):
         self.root = root
         self.root.title("Banner Manager - Realtime Preview & Sorting")
-        self.root.geometry("1200x700")
+        self.root.geometry("1200x820")
         self.root.configure(bg="white")
 
         self.slides = []
         self.current_index = 0
         self.photo = None
         self.banner_enabled = True   # Banner Status
+        self.preview_cache = PreviewCache()
+
+        # Previews are decoded by a worker thread; the Tk thread only wraps
+        # finished PIL images in PhotoImages (Tk is not thread-safe).
+        self.prefetch_requests = queue.LifoQueue()
+        self.prefetch_results = queue.Queue()
+        self.prefetch_pending = set()
+        self.prefetch_failed = set()
+        self.prefetch_polling = False
+        threading.Thread(target=self.prefetch_worker, daemon=True).start()
+
+        # Filmstrip thumbnails are built in worker processes and cached on
+        # disk; only the cells currently scrolled into view hold PhotoImages.
+        self.thumb_pool = ProcessPoolExecutor()
+        self.thumb_futures = {}
+        self.thumb_paths = {}
+        self.filmstrip_photos = {}
+        self.thumb_polling = False
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Media copies and poster extraction run on a background thread and
+        # report back through a queue
+        self.ingest_thread = None
+        self.ingest_events = queue.Queue()
 
         os.makedirs(MEDIA_FOLDER, exist_ok=True)
 
-        self.load_html()
+        self.load_slides()
         self.create_ui()
         self.refresh_slide_list()
+        self.prefetch_all()
         self.display_slide()
+        self.start_poster_backfill()
 
     # ---------------------------------------------------
-    # LOAD HTML
+    # LOAD SLIDES
     # ---------------------------------------------------
-    def load_html(self):
+    def load_slides(self):
 
-        if not os.path.exists(HTML_FILE):
+        if os.path.exists(MANIFEST_FILE):
+            self.banner_enabled, self.slides = load_manifest()
             return
 
-        with open(HTML_FILE, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Detect if banner is disabled
-        if "<!-- Banner Disabled" in content:
-            self.banner_enabled = False
-
-        slide_blocks = re.findall(
-            r'<div class="slide.*?">.*?</div>', content, re.DOTALL)
-
-        self.slides.clear()
-
-        for block in slide_blocks:
-
-            if "<img" in block:
-                file_match = re.search(
-                    r'src="\.\/banner\/banner_img\/(.*?)"', block)
-                caption_match = re.search(r'<p>"(.*?)"</p>', block)
-
-                if file_match:
-                    self.slides.append({
-                        "type": "image",
-                        "file": file_match.group(1),
-                        "caption": caption_match.group(1) if caption_match else ""
-                    })
-
-            elif "<video" in block:
-                file_match = re.search(
-                    r'src="\.\/banner\/banner_img\/(.*?)"', block)
-                caption_match = re.search(r'<p>(.*?)</p>', block)
-
-                if file_match:
-                    self.slides.append({
-                        "type": "video",
-                        "file": file_match.group(1),
-                        "caption": caption_match.group(1) if caption_match else ""
-                    })
+        # First run after upgrading: import the existing banner.html once
+        if os.path.exists(HTML_FILE):
+            self.banner_enabled, self.slides = import_banner_html()
+            save_manifest(self.banner_enabled, self.slides)
 
     # ---------------------------------------------------
     # UI
@@ -110,10 +565,24 @@ class BannerManager:
             right_frame, font=("Arial", 14), width=80)
         self.caption_entry.pack(pady=10)
 
+        filmstrip_frame = tk.Frame(right_frame, bg="white")
+        filmstrip_frame.pack(fill="x", padx=20)
+
+        self.filmstrip = tk.Canvas(
+            filmstrip_frame, height=THUMB_SIZE[1] + 30, bg="#f0f0f0",
+            highlightthickness=0)
+        filmstrip_scroll = ttk.Scrollbar(
+            filmstrip_frame, orient="horizontal", command=self.scroll_filmstrip)
+        self.filmstrip.configure(xscrollcommand=filmstrip_scroll.set)
+        self.filmstrip.pack(fill="x")
+        filmstrip_scroll.pack(fill="x")
+        self.filmstrip.bind("<Configure>", lambda e: self.update_filmstrip_images())
+        self.filmstrip.bind("<Button-1>", self.on_filmstrip_click)
+
         btn_frame = tk.Frame(right_frame, bg="white")
         btn_frame.pack(pady=15)
 
-        ttk.Button(btn_frame, text="Add Slide",
+        ttk.Button(btn_frame, text="Add Slides",
                    command=self.add_slide).grid(row=0, column=0, padx=5)
 
         ttk.Button(btn_frame, text="Update Caption",
@@ -130,6 +599,17 @@ class BannerManager:
             command=self.toggle_banner)
         self.toggle_btn.grid(row=0, column=4, padx=5)
 
+        ttk.Button(btn_frame, text="Set Video Poster",
+                   command=self.choose_poster).grid(row=1, column=0, columnspan=2, pady=5)
+
+        ingest_frame = tk.Frame(right_frame, bg="white")
+        ingest_frame.pack()
+        self.ingest_label = tk.Label(ingest_frame, text="", bg="white")
+        self.ingest_label.pack(side="left", padx=5)
+        self.ingest_progress = ttk.Progressbar(
+            ingest_frame, mode="determinate", maximum=100, length=400)
+        self.ingest_progress.pack(side="left")
+
         self.update_toggle_button()
 
     # ---------------------------------------------------
@@ -146,8 +626,10 @@ class BannerManager:
     # ---------------------------------------------------
     def toggle_banner(self):
         self.banner_enabled = not self.banner_enabled
+        if not self.generate_html():
+            self.banner_enabled = not self.banner_enabled
+            return
         self.update_toggle_button()
-        self.generate_html()
 
         status = "Enabled" if self.banner_enabled else "Disabled"
         messagebox.showinfo("Banner Status",
@@ -167,6 +649,126 @@ class BannerManager:
         if self.slides:
             self.slide_listbox.select_set(self.current_index)
 
+        self.refresh_filmstrip()
+
+    # ---------------------------------------------------
+    # Filmstrip
+    # ---------------------------------------------------
+    def slide_path(self, index):
+        return os.path.join(MEDIA_FOLDER, self.slides[index]["file"])
+
+    def preview_path(self, index):
+        """Image shown for a slide: the image itself, or a video's poster"""
+        slide = self.slides[index]
+        if slide["type"] == "image":
+            return self.slide_path(index)
+        if slide.get("poster"):
+            return os.path.join(MEDIA_FOLDER, slide["poster"])
+        return None
+
+    def refresh_filmstrip(self):
+        self.filmstrip.delete("all")
+        self.filmstrip_photos.clear()
+
+        for index, slide in enumerate(self.slides):
+            x = index * FILMSTRIP_CELL + 6
+            outline = "#0078d7" if index == self.current_index else "#c8c8c8"
+            self.filmstrip.create_rectangle(
+                x - 3, 3, x + THUMB_SIZE[0] + 3, THUMB_SIZE[1] + 9,
+                outline=outline, width=3 if index == self.current_index else 1,
+                fill="black")
+            placeholder = "VIDEO" if slide["type"] == "video" and not slide.get("poster") else "..."
+            self.filmstrip.create_text(
+                x + THUMB_SIZE[0] // 2, THUMB_SIZE[1] // 2 + 6,
+                text=placeholder, fill="white")
+            self.filmstrip.create_text(
+                x + THUMB_SIZE[0] // 2, THUMB_SIZE[1] + 20,
+                text=f"{index+1}. {slide['file']}"[:22], font=("Arial", 8))
+
+            if self.preview_path(index):
+                self.request_thumbnail(self.preview_path(index))
+
+        self.filmstrip.configure(
+            scrollregion=(0, 0, len(self.slides) * FILMSTRIP_CELL, THUMB_SIZE[1] + 30))
+        self.update_filmstrip_images()
+
+    def thumb_key(self, file_path):
+        """Thumbnails are keyed like previews, so a replaced file (e.g. a new poster) gets a new one"""
+        try:
+            return self.preview_cache.key(file_path)
+        except OSError:
+            return None
+
+    def request_thumbnail(self, file_path):
+        key = self.thumb_key(file_path)
+        if key is None or key in self.thumb_paths or key in self.thumb_futures:
+            return
+        self.thumb_futures[key] = self.thumb_pool.submit(build_thumbnail, file_path)
+        if not self.thumb_polling:
+            self.thumb_polling = True
+            self.root.after(THUMB_POLL_MS, self.collect_thumbnails)
+
+    def collect_thumbnails(self):
+        done = [key for key, future in self.thumb_futures.items() if future.done()]
+        for key in done:
+            future = self.thumb_futures.pop(key)
+            try:
+                self.thumb_paths[key] = future.result()
+            except Exception as e:
+                print(f"Thumbnail failed for {key[0]}: {e}")
+
+        if done:
+            self.update_filmstrip_images()
+
+        if self.thumb_futures:
+            self.root.after(THUMB_POLL_MS, self.collect_thumbnails)
+        else:
+            self.thumb_polling = False
+
+    def visible_filmstrip_range(self):
+        left = self.filmstrip.canvasx(0)
+        right = left + max(self.filmstrip.winfo_width(), 1)
+        first = max(0, int(left // FILMSTRIP_CELL) - 1)
+        last = min(len(self.slides), int(right // FILMSTRIP_CELL) + 2)
+        return range(first, last)
+
+    def update_filmstrip_images(self):
+        visible = self.visible_filmstrip_range()
+
+        for index in list(self.filmstrip_photos):
+            if index not in visible:
+                item, _ = self.filmstrip_photos.pop(index)
+                self.filmstrip.delete(item)
+
+        for index in visible:
+            if index in self.filmstrip_photos or not self.preview_path(index):
+                continue
+            thumb_path = self.thumb_paths.get(self.thumb_key(self.preview_path(index)))
+            if not thumb_path or not os.path.exists(thumb_path):
+                continue
+            try:
+                photo = ImageTk.PhotoImage(Image.open(thumb_path))
+            except OSError:
+                continue
+            item = self.filmstrip.create_image(
+                index * FILMSTRIP_CELL + 6, 6, image=photo, anchor="nw")
+            self.filmstrip_photos[index] = (item, photo)
+
+    def scroll_filmstrip(self, *args):
+        self.filmstrip.xview(*args)
+        self.update_filmstrip_images()
+
+    def on_filmstrip_click(self, event):
+        index = int(self.filmstrip.canvasx(event.x) // FILMSTRIP_CELL)
+        if 0 <= index < len(self.slides) and index != self.current_index:
+            self.current_index = index
+            self.refresh_slide_list()
+            self.display_slide()
+
+    def on_close(self):
+        self.thumb_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
     # ---------------------------------------------------
     # Select Slide
     # ---------------------------------------------------
@@ -193,15 +795,23 @@ class BannerManager:
             return
 
         slide = self.slides[self.current_index]
-        file_path = os.path.join(MEDIA_FOLDER, slide["file"])
+        file_path = self.preview_path(self.current_index)
 
-        if slide["type"] == "image" and os.path.exists(file_path):
-            img = Image.open(file_path)
-            img = img.resize((800, 450))
-            self.photo = ImageTk.PhotoImage(img)
+        if file_path and os.path.exists(file_path):
+            photo = self.preview_cache.peek(file_path)
 
-            tk.Label(self.preview_frame,
-                     image=self.photo).pack(fill="both", expand=True)
+            if photo is not None:
+                self.photo = photo
+                tk.Label(self.preview_frame,
+                         image=self.photo).pack(fill="both", expand=True)
+            else:
+                status = "Preview unavailable" if file_path in self.prefetch_failed else "Loading preview..."
+                tk.Label(self.preview_frame,
+                         text=f"{status}\n\n{slide['file']}",
+                         fg="white",
+                         bg="black",
+                         font=("Arial", 18),
+                         justify="center").pack(expand=True)
         else:
             tk.Label(self.preview_frame,
                      text=f"VIDEO PREVIEW\n\n{slide['file']}",
@@ -213,6 +823,78 @@ class BannerManager:
         self.caption_entry.delete(0, tk.END)
         self.caption_entry.insert(0, slide["caption"])
 
+        self.prefetch_around(self.current_index)
+
+    # ---------------------------------------------------
+    # Background Preview Prefetch
+    # ---------------------------------------------------
+    def prefetch_worker(self):
+        while True:
+            file_path = self.prefetch_requests.get()
+            try:
+                key = self.preview_cache.key(file_path)
+                img = load_preview_image(file_path, self.preview_cache.size)
+            except Exception as e:
+                print(f"Preview prefetch failed for {file_path}: {e}")
+                key, img = None, None
+            self.prefetch_results.put((file_path, key, img))
+
+    def request_preview(self, index):
+        if not 0 <= index < len(self.slides):
+            return
+        file_path = self.preview_path(index)
+        if not file_path:
+            return
+        if file_path in self.prefetch_pending or file_path in self.prefetch_failed:
+            return
+        if not os.path.exists(file_path):
+            return
+        if self.preview_cache.peek(file_path) is not None:
+            return
+
+        self.prefetch_pending.add(file_path)
+        self.prefetch_requests.put(file_path)
+        if not self.prefetch_polling:
+            self.prefetch_polling = True
+            self.root.after(PREFETCH_POLL_MS, self.drain_prefetch)
+
+    def prefetch_around(self, index):
+        # LIFO queue: the current slide is requested last so it is decoded first
+        self.request_preview(index + 1)
+        self.request_preview(index - 1)
+        self.request_preview(index)
+
+    def prefetch_all(self):
+        for index in reversed(range(len(self.slides))):
+            self.request_preview(index)
+        self.prefetch_around(self.current_index)
+
+    def drain_prefetch(self):
+        current_ready = False
+
+        while True:
+            try:
+                file_path, key, img = self.prefetch_results.get_nowait()
+            except queue.Empty:
+                break
+            self.prefetch_pending.discard(file_path)
+            if img is None:
+                self.prefetch_failed.add(file_path)
+            else:
+                self.preview_cache.put(key, img)
+
+            if self.slides and 0 <= self.current_index < len(self.slides):
+                current = self.preview_path(self.current_index)
+                current_ready = current_ready or current == file_path
+
+        if current_ready:
+            self.display_slide()
+
+        if self.prefetch_pending:
+            self.root.after(PREFETCH_POLL_MS, self.drain_prefetch)
+        else:
+            self.prefetch_polling = False
+
     # ---------------------------------------------------
     # Move Up
     # ---------------------------------------------------
@@ -240,28 +922,174 @@ class BannerManager:
     # ---------------------------------------------------
     def add_slide(self):
 
-        file_path = filedialog.askopenfilename(
+        file_paths = filedialog.askopenfilenames(
             filetypes=[("Media Files", "*.jpg *.png *.jpeg *.mp4")]
         )
 
-        if not file_path:
+        if not file_paths:
             return
 
-        filename = os.path.basename(file_path)
-        dest_path = os.path.join(MEDIA_FOLDER, filename)
+        if self.ingest_thread is not None and self.ingest_thread.is_alive():
+            messagebox.showinfo("Add Slides", "Please wait until the current files have been added.")
+            return
 
-        if not os.path.exists(dest_path):
-            shutil.copy(file_path, dest_path)
+        self.ingest_progress["value"] = 0
+        if len(file_paths) == 1:
+            self.ingest_label.config(text=f"Copying {os.path.basename(file_paths[0])}...")
+        else:
+            self.ingest_label.config(text=f"Preparing {len(file_paths)} files...")
+        self.ingest_thread = threading.Thread(
+            target=self.ingest_worker, args=(list(file_paths),), daemon=True)
+        self.ingest_thread.start()
+        self.root.after(INGEST_POLL_MS, self.poll_ingest)
+
+    def ingest_worker(self, file_paths):
+        staged = [None] * len(file_paths)
+        report = lambda done, total: self.ingest_events.put(("progress", done, total))
+
+        if len(file_paths) == 1:
+            # A single (possibly large) file is staged here so the bar can follow its bytes
+            try:
+                staged[0] = prepare_media(file_paths[0], report)
+            except Exception as e:
+                staged[0] = e
+        else:
+            with ProcessPoolExecutor() as pool:
+                futures = {pool.submit(prepare_media, path): i for i, path in enumerate(file_paths)}
+                for done, future in enumerate(as_completed(futures), 1):
+                    try:
+                        staged[futures[future]] = future.result()
+                    except Exception as e:
+                        staged[futures[future]] = e
+                    report(done, len(file_paths))
+
+        # Naming and dedupe happen here, in selection order, so workers never race for a name
+        slides, errors = [], []
+        known = media_hashes()
+        for path, result in zip(file_paths, staged):
+            try:
+                if isinstance(result, Exception):
+                    raise result
+                tmp_path, sha256 = result
+                filename, reused = store_media(tmp_path, sha256, path, known)
+                poster = extract_poster(filename) if filename.lower().endswith(".mp4") else ""
+                slides.append(({
+                    "type": "video" if filename.lower().endswith(".mp4") else "image",
+                    "file": filename,
+                    "caption": "New Caption",
+                    "poster": poster or "",
+                    "sha256": sha256
+                }, reused))
+            except Exception as e:
+                errors.append((path, e))
+
+        self.ingest_events.put(("done", slides, errors))
+
+    def start_poster_backfill(self):
+        """Extract missing video posters (e.g. of slides imported from banner.html) on the ingest thread"""
+        videos = [slide["file"] for slide in self.slides
+                  if slide["type"] == "video" and not slide.get("poster")]
+        if not videos:
+            return
+        self.ingest_thread = threading.Thread(target=self.poster_worker, args=(videos,), daemon=True)
+        self.ingest_thread.start()
+        self.root.after(INGEST_POLL_MS, self.poll_ingest)
+
+    def poster_worker(self, video_files):
+        posters = {}
+        for video_file in video_files:
+            poster = extract_poster(video_file)
+            if poster:
+                posters[video_file] = poster
+        self.ingest_events.put(("posters", posters))
+
+    def poll_ingest(self):
+
+        while True:
+            try:
+                event = self.ingest_events.get_nowait()
+            except queue.Empty:
+                break
+
+            if event[0] == "progress":
+                done, total = event[1:]
+                self.ingest_progress["value"] = 100 * done / total if total else 100
+                continue
+
+            if event[0] == "variants":
+                digests, variants = event[1:]
+                self.ingest_label.config(text="")
+                for slide in self.slides:
+                    if slide["file"] in digests:
+                        size = variants.get(os.path.join(MEDIA_FOLDER, slide["file"])) or {}
+                        slide.update(sha256=digests[slide["file"]],
+                                     width=size.get("width"), height=size.get("height"))
+                self.publish_banner(variants)
+                continue
+
+            if event[0] == "posters":
+                posters = event[1]
+                for slide in self.slides:
+                    if slide["type"] == "video" and not slide.get("poster"):
+                        slide["poster"] = posters.get(slide["file"], "")
+                if posters:
+                    self.refresh_filmstrip()
+                    self.prefetch_all()
+                    if self.slides and self.slides[self.current_index]["file"] in posters:
+                        self.display_slide()
+                continue
+
+            slides, errors = event[1:]
+            reused = sum(1 for _, was_reused in slides if was_reused)
+            self.ingest_progress["value"] = 100 if slides else 0
+
+            if len(slides) == 1:
+                filename = slides[0][0]["file"]
+                self.ingest_label.config(
+                    text=f"Reused existing {filename}" if reused else f"Added {filename}")
+            elif slides:
+                self.ingest_label.config(
+                    text=f"Added {len(slides)} slides ({reused} already in the library)")
+            else:
+                self.ingest_label.config(text="")
 
-        slide_type = "video" if filename.lower().endswith(".mp4") else "image"
+            if slides:
+                self.slides.extend(slide for slide, _ in slides)
+                self.current_index = len(self.slides) - 1
+                self.refresh_slide_list()
+                self.prefetch_all()
+                self.display_slide()
+
+            if errors:
+                details = "\n".join(f"{os.path.basename(path)}: {error}" for path, error in errors)
+                messagebox.showerror("Error", f"Unable to add:\n{details}")
+
+        if self.ingest_thread.is_alive() or not self.ingest_events.empty():
+            self.root.after(INGEST_POLL_MS, self.poll_ingest)
 
-        self.slides.append({
-            "type": slide_type,
-            "file": filename,
-            "caption": "New Caption"
-        })
+    # ---------------------------------------------------
+    # Video Poster
+    # ---------------------------------------------------
+    def choose_poster(self):
+
+        if not self.slides or self.slides[self.current_index]["type"] != "video":
+            messagebox.showinfo("Video Poster", "Select a video slide first.")
+            return
+
+        slide = self.slides[self.current_index]
+        image_path = filedialog.askopenfilename(
+            title=f"Poster image for {slide['file']}",
+            filetypes=[("Images", "*.jpg *.jpeg *.png")]
+        )
+        if not image_path:
+            return
+
+        try:
+            slide["poster"] = save_user_poster(slide["file"], image_path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Unable to use this image:\n{e}")
+            return
 
-        self.current_index = len(self.slides) - 1
         self.refresh_slide_list()
         self.display_slide()
 
@@ -291,7 +1119,10 @@ class BannerManager:
 
         if confirm:
 
-            if os.path.exists(file_path):
+            # Deduplicated media can back several slides; keep it while still referenced
+            shared = sum(s["file"] == slide["file"] for s in self.slides) > 1
+
+            if not shared and os.path.exists(file_path):
                 try:
                     os.remove(file_path)
                 except Exception as e:
@@ -315,8 +1146,24 @@ class BannerManager:
     # ---------------------------------------------------
     # Generate HTML
     # ---------------------------------------------------
-    def generate_html(self):
-
+    def variants_worker(self, files):
+        """Ingest-thread half of generate_html: hash the slides' media and build image variants.
+
+        Hashes come from the stat-keyed media cache; the resizing runs in the
+        thumbnail pool. Reports ("variants", {file: sha256}, {path: variants}).
+        """
+        try:
+            digests = media_digests()
+            images = sorted({os.path.join(MEDIA_FOLDER, f) for f in files
+                             if f in digests and not f.lower().endswith(".mp4")})
+            hashes = [digests[os.path.basename(path)] for path in images]
+            variants = dict(zip(images, self.thumb_pool.map(build_variants, images, hashes)))
+        except Exception as e:
+            print(f"Responsive variant build failed: {e}")
+            digests, variants = {}, {}
+        self.ingest_events.put(("variants", digests, variants))
+
+    def render_html(self, variants):
         if self.banner_enabled:
             html_content = "<!-- Banner Start -->\n"
         else:
@@ -330,16 +1177,28 @@ class BannerManager:
 
         for i, slide in enumerate(self.slides):
             active = " show" if i == 0 else ""
+            # Only the first slide's media is fetched with the page
+            lazy = i > 0
+            src_attr = "data-src" if lazy else "src"
+            caption = html.escape(slide["caption"], quote=False)
             html_content += f'    <div class="slide{active}">\n'
 
             if slide["type"] == "image":
-                html_content += f'        <img src="./banner/banner_img/{slide["file"]}" />\n'
-                html_content += f'        <p>"{slide["caption"]}"</p>\n'
+                slide_variants = variants.get(os.path.join(MEDIA_FOLDER, slide["file"]))
+                if slide_variants:
+                    html_content += picture_markup(slide_variants, slide["caption"], lazy)
+                else:
+                    html_content += f'        <img {src_attr}="./banner/banner_img/{slide["file"]}" />\n'
+                html_content += f'        <p>"{caption}"</p>\n'
             else:
-                html_content += f'        <video controls>\n'
-                html_content += f'            <source src="./banner/banner_img/{slide["file"]}" type="video/mp4">\n'
+                poster = ""
+                if slide.get("poster"):
+                    poster_attr = "data-poster" if lazy else "poster"
+                    poster = f' {poster_attr}="./banner/banner_img/{slide["poster"]}"'
+                html_content += f'        <video controls preload="none"{poster}>\n'
+                html_content += f'            <source {src_attr}="./banner/banner_img/{slide["file"]}" type="video/mp4">\n'
                 html_content += f'        </video>\n'
-                html_content += f'        <p>{slide["caption"]}</p>\n'
+                html_content += f'        <p>{caption}</p>\n'
 
             html_content += f'        <a href="./banner/banner_img/{slide["file"]}" download="{slide["file"]}" class="downloadBtn">Download</a>\n'
             html_content += "    </div>\n"
@@ -355,10 +1214,60 @@ class BannerManager:
 Banner End -->
 """
 
-        with open(HTML_FILE, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        # Fallback <img> tags use image_optimizer's output when there is one
+        html_content = rewrite_html(html_content, optimized_sources())
+        if not READABLE_HTML:
+            html_content = minify_html(html_content)
+        return html_content
 
-        messagebox.showinfo("Success", "Banner Updated Successfully")
+    def generate_html(self):
+        """Start publishing the banner; returns False while other media work is running.
+
+        Image variants are built on the ingest thread and publish_banner()
+        finishes on the Tk thread once they are reported.
+        """
+        if self.ingest_thread is not None and self.ingest_thread.is_alive():
+            messagebox.showinfo("Generate HTML", "Please wait until the current media work has finished.")
+            return False
+
+        self.ingest_label.config(text="Building image sizes...")
+        files = [slide["file"] for slide in self.slides]
+        self.ingest_thread = threading.Thread(target=self.variants_worker, args=(files,), daemon=True)
+        self.ingest_thread.start()
+        self.root.after(INGEST_POLL_MS, self.poll_ingest)
+        return True
+
+    def publish_banner(self, variants):
+
+        # Posters are extracted on the ingest thread; a video still without
+        # one is published without a poster attribute
+        save_manifest(self.banner_enabled, self.slides)
+
+        banner_html = self.render_html(variants)
+        write_page(HTML_FILE, banner_html)
+
+        # Inlines the banner into index.html and recompresses what changed;
+        # banner.html is saved either way and the next build retries
+        try:
+            run_site_build()
+        except Exception as e:
+            messagebox.showerror("Build Error", f"Banner saved, but index.html was not updated:\n{e}\n\n"
+                                                "Run 'python site_build.py' to retry.")
+        else:
+            messagebox.showinfo("Success", "Banner Updated Successfully")
+
+        # Checked after the build, so the banner inlined into index.html is current
+        try:
+            broken_links = new_broken_links()
+        except Exception as e:
+            print(f"Link check error: {e}")
+            broken_links = []
+
+        if broken_links:
+            details = "\n".join(f"{page} -> {target}" for page, target in broken_links[:10])
+            if len(broken_links) > 10:
+                details += f"\n... and {len(broken_links) - 10} more"
+            messagebox.showwarning("Broken Links", f"These links now point at missing files:\n{details}")
 
 
 # ---------------------------------------------------
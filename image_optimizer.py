@@ -0,0 +1,180 @@
+"""Site-wide image optimizer for img/ and banner/banner_img.
+
+Every JPEG/PNG is downsized to OPTIMIZE_MAX_EDGE and recompressed into an
+optimized/ subfolder under a content-hashed name, across all cores. A
+manifest in .publish/ records the source hash of each file so unchanged
+images are skipped on later runs. <img src> references in the site's pages
+are then rewritten to the optimized outputs; the originals stay in place for
+downloads and CSS. Generated HTML applies the same mapping as it is written
+(banner_manager.render_html, site_build.inline_banner), so regenerating
+banner.html or its inline copy in index.html keeps the optimized sources.
+
+Usage:  python image_optimizer.py
+"""
+import glob
+import hashlib
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageOps
+
+from site_publish import IMAGE_MANIFEST, load_json, manifest_key, precompress, save_json
+
+IMAGE_FOLDERS = ("img", "banner/banner_img")
+OPTIMIZED_SUBFOLDER = "optimized"
+OPTIMIZABLE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+OPTIMIZE_MAX_EDGE = 1600
+JPEG_QUALITY = 82
+
+# The src attribute itself: whitespace before it, so data-src (lazy slides) is left alone
+IMG_SRC_PATTERN = re.compile(
+    r"""(<img\b[^>]*?\ssrc\s*=\s*["'])(\.?/?)([^"'?#]+)(["'])""", re.IGNORECASE)
+
+
+# -------------------- Optimizing --------------------
+def source_images(folders=IMAGE_FOLDERS):
+    """Top-level images only; generated subfolders (optimized/, variants/, posters/) are skipped"""
+    for folder in folders:
+        if not os.path.isdir(folder):
+            continue
+        for entry in sorted(os.scandir(folder), key=lambda e: e.name):
+            if entry.is_file() and entry.name.lower().endswith(OPTIMIZABLE_EXTENSIONS):
+                yield manifest_key(entry.path)
+
+
+def optimize_image(path, previous=None):
+    """Process-pool worker: write the optimized copy of one image.
+
+    `previous` is the manifest entry from the last run; when the source hash
+    still matches and its output exists, nothing is decoded. Returns
+    (path, manifest entry). The entry's "output" is None when recompressing
+    would not make the file smaller.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+
+    if previous and previous.get("sha256") == digest and (
+            previous.get("output") is None or os.path.exists(previous["output"])):
+        return path, previous
+
+    folder, name = os.path.split(path)
+    stem, ext = os.path.splitext(name)
+    out_folder = os.path.join(folder, OPTIMIZED_SUBFOLDER)
+
+    with Image.open(path) as img:
+        img = ImageOps.exif_transpose(img)
+        img.thumbnail((OPTIMIZE_MAX_EDGE, OPTIMIZE_MAX_EDGE), Image.LANCZOS)
+        has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+        out_ext = ".png" if has_alpha else ".jpg"
+        out_path = manifest_key(os.path.join(out_folder, f"{stem}-{digest[:10]}{out_ext}"))
+
+        os.makedirs(out_folder, exist_ok=True)
+        tmp_path = f"{out_path}.{os.getpid()}.tmp"
+        if has_alpha:
+            img.save(tmp_path, "PNG", optimize=True)
+        else:
+            img.convert("RGB").save(tmp_path, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+        width, height = img.size
+
+    entry = {"sha256": digest, "width": width, "height": height,
+             "original_bytes": len(data), "output": None}
+    if os.path.getsize(tmp_path) < len(data):
+        os.replace(tmp_path, out_path)
+        entry["output"] = out_path
+        entry["optimized_bytes"] = os.path.getsize(out_path)
+    else:
+        os.remove(tmp_path)
+    return path, entry
+
+
+def optimize_images(workers=None):
+    """Optimize every image, drop outputs of removed/changed sources, and return the manifest"""
+    previous = load_json(IMAGE_MANIFEST, {})
+    paths = list(source_images())
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = dict(pool.map(optimize_image, paths, [previous.get(p) for p in paths], chunksize=4))
+
+    live_outputs = {entry["output"] for entry in results.values() if entry["output"]}
+    for entry in previous.values():
+        stale = entry.get("output")
+        if stale and stale not in live_outputs and os.path.exists(stale):
+            os.remove(stale)
+
+    save_json(IMAGE_MANIFEST, results)
+    return results, previous
+
+
+# -------------------- Reference Rewriting --------------------
+def rewrite_map(manifest, previous):
+    """Map every path a page may still reference (original or stale output) to the current output"""
+    mapping = {}
+    for path, entry in manifest.items():
+        target = entry["output"] or path
+        mapping[path] = target
+        old_output = previous.get(path, {}).get("output")
+        if old_output:
+            mapping[old_output] = target
+    return {old: new for old, new in mapping.items() if old != new}
+
+
+def optimized_sources(manifest=None):
+    """{source image: optimized output} as of the last run, for HTML generated later"""
+    manifest = load_json(IMAGE_MANIFEST, {}) if manifest is None else manifest
+    return {path: entry["output"] for path, entry in manifest.items() if entry.get("output")}
+
+
+def rewrite_html(content, mapping):
+    """Point <img src> references found in `mapping` at their replacements"""
+    def replace(match):
+        target = mapping.get(manifest_key(match.group(3)))
+        if target is None:
+            return match.group(0)
+        return f"{match.group(1)}{match.group(2)}{target}{match.group(4)}"
+
+    return IMG_SRC_PATTERN.sub(replace, content) if mapping else content
+
+
+def rewrite_page(page, mapping):
+    with open(page, "r", encoding="utf-8") as f:
+        original = f.read()
+
+    content = rewrite_html(original, mapping)
+    if content == original:
+        return False
+
+    tmp_path = page + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, page)
+    return True
+
+
+def rewrite_pages(mapping, pages=None):
+    if pages is None:
+        pages = sorted(glob.glob("*.html"))
+    return [page for page in pages if mapping and rewrite_page(page, mapping)]
+
+
+def optimize_site(root="."):
+    previous_cwd = os.getcwd()
+    os.chdir(root)
+    try:
+        manifest, previous = optimize_images()
+        changed_pages = rewrite_pages(rewrite_map(manifest, previous))
+        if changed_pages:
+            precompress(changed_pages)
+        return manifest, changed_pages
+    finally:
+        os.chdir(previous_cwd)
+
+
+if __name__ == "__main__":
+    manifest, changed_pages = optimize_site(sys.argv[1] if len(sys.argv) > 1 else ".")
+    before = sum(entry["original_bytes"] for entry in manifest.values())
+    after = sum(entry.get("optimized_bytes", entry["original_bytes"]) for entry in manifest.values())
+    print(f"Optimized {len(manifest)} images: {before / 1e6:.1f} MB -> {after / 1e6:.1f} MB")
+    print(f"Rewrote <img> references in {len(changed_pages)} pages")
@@ -0,0 +1,180 @@
+"""Link and asset reference checker for the whole site.
+
+Parses every HTML page concurrently, builds a reference graph of local
+href/src targets and reports references to missing files (broken) as well
+as files under ASSET_FOLDERS that no page references (unreferenced). Links
+that pages render from JSON data (the notice attachments in notices.json)
+are checked the same way.
+
+notice_admin.py and banner_manager.py call new_broken_links() once a save
+and its site build are done, so a save that introduced a dead link, in its
+page or in a file derived from it, is flagged right away.
+
+Usage:  python link_checker.py [root]
+"""
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import unquote, urlsplit
+
+from site_publish import PUBLISH_STATE_FOLDER, SKIP_FOLDERS, load_json, manifest_key, save_json
+
+ASSET_FOLDERS = ("notices", "contents", "banner/banner_img", "img", "files")
+REFERENCE_ATTRIBUTES = {"href", "src", "srcset", "data-src", "data-srcset", "poster", "data-poster", "imagesrcset"}
+EXTERNAL_SCHEMES = ("http:", "https:", "mailto:", "tel:", "javascript:", "data:", "//")
+LINK_REPORT = os.path.join(PUBLISH_STATE_FOLDER, "link-report.json")
+CSS_URL_PATTERN = re.compile(r"""url\(\s*['"]?([^'")]+)""")
+# JSON files whose records hold site-relative links: path -> record field
+JSON_LINK_FIELDS = {"notices.json": "file_link"}
+# Derived files are referenced implicitly (content negotiation), never by pages
+DERIVED_SUFFIXES = (".gz", ".br", ".tmp")
+
+
+# -------------------- Parsing --------------------
+class ReferenceParser(HTMLParser):
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.references = []
+
+    def handle_starttag(self, tag, attrs):
+        for name, value in attrs:
+            if name not in REFERENCE_ATTRIBUTES or not value:
+                continue
+            if name.endswith("srcset"):
+                self.references.extend(
+                    candidate.split()[0] for candidate in value.split(",") if candidate.strip())
+            else:
+                self.references.append(value)
+
+    handle_startendtag = handle_starttag
+
+
+def json_references(text, field):
+    """`field` of every record in a DataTables-style {"data": [...]} file"""
+    try:
+        records = json.loads(text).get("data", [])
+    except (ValueError, AttributeError):
+        return []
+    return [record.get(field) or "" for record in records if isinstance(record, dict)]
+
+
+def resolve_reference(page, reference):
+    """Site-relative path a reference points at, or None for external/anchor links"""
+    reference = reference.strip()
+    if not reference or reference.startswith("#") or reference.lower().startswith(EXTERNAL_SCHEMES):
+        return None
+    path = unquote(urlsplit(reference).path)
+    if not path:
+        return None
+    if path.startswith("/"):
+        resolved = path.lstrip("/")
+    else:
+        resolved = os.path.join(os.path.dirname(page), path)
+    return manifest_key(resolved)
+
+
+def page_references(page, html=None):
+    """Resolved local references of one HTML page (or stylesheet, via url(), or JSON data file)"""
+    if html is None:
+        with open(page, "r", encoding="utf-8", errors="replace") as f:
+            html = f.read()
+    if page.lower().endswith(".css"):
+        references = CSS_URL_PATTERN.findall(html)
+    elif page in JSON_LINK_FIELDS:
+        references = json_references(html, JSON_LINK_FIELDS[page])
+    else:
+        parser = ReferenceParser()
+        parser.feed(html)
+        parser.close()
+        references = parser.references
+    return page, {ref for ref in (resolve_reference(page, r) for r in references) if ref}
+
+
+# -------------------- Checking --------------------
+def site_inventory(root="."):
+    """(pages, stylesheets and JSON link sources, every file) in one walk, as site-relative keys"""
+    pages, files = [], set()
+    for folder, dirs, names in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in SKIP_FOLDERS]
+        for name in names:
+            key = manifest_key(os.path.relpath(os.path.join(folder, name), root))
+            files.add(key)
+            if name.lower().endswith((".html", ".css")) or key in JSON_LINK_FIELDS:
+                pages.append(key)
+    return sorted(pages), files
+
+
+def check_site(root=".", overrides=None, workers=8):
+    """Build the reference graph and report what is broken or unused.
+
+    `overrides` maps page paths to HTML that is about to be written, so a
+    check can run against a save before it reaches the disk. Returns a dict
+    with "graph" (page -> targets), "broken" (page -> missing targets) and
+    "unreferenced" (asset paths).
+    """
+    overrides = {manifest_key(page): html for page, html in (overrides or {}).items()}
+    previous_cwd = os.getcwd()
+    os.chdir(root)
+    try:
+        pages, files = site_inventory(".")
+        pages = sorted(set(pages) | set(overrides))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            graph = dict(pool.map(lambda page: page_references(page, overrides.get(page)), pages))
+    finally:
+        os.chdir(previous_cwd)
+
+    files |= set(overrides)
+    folders = {manifest_key(os.path.dirname(f)) for f in files}
+    broken = {}
+    for page, targets in graph.items():
+        # A reference to a folder (e.g. "./") is served by its index page
+        missing = sorted(t for t in targets if t not in files and t.rstrip("/") not in folders
+                         and t not in ("", "."))
+        if missing:
+            broken[page] = missing
+
+    referenced = set().union(*graph.values()) if graph else set()
+    unreferenced = sorted(
+        f for f in files
+        if f.startswith(tuple(folder + "/" for folder in ASSET_FOLDERS))
+        and not f.endswith(DERIVED_SUFFIXES) and f not in referenced)
+
+    return {"graph": {page: sorted(targets) for page, targets in graph.items()},
+            "broken": broken, "unreferenced": unreferenced}
+
+
+def new_broken_links(root=".", pending=None):
+    """Post-save hook for the admin tools.
+
+    Checks the site (with `pending`, path -> HTML, standing in for pages not
+    written yet) and returns the broken (page, target) pairs that were not
+    already reported by the last check, so long-standing problems are not
+    repeated on every save. Run it after the site build: derived files such
+    as notices.json and index.html are only current by then.
+    """
+    report_path = os.path.join(root, LINK_REPORT)
+    report = check_site(root, overrides=pending)
+    # First run: whatever is broken now is the baseline
+    previous = load_json(report_path, None) or report
+    known = {(p, t) for p, targets in previous.get("broken", {}).items() for t in targets}
+
+    save_json(report_path, {"broken": report["broken"], "unreferenced": report["unreferenced"]})
+    return sorted((p, t) for p, targets in report["broken"].items() for t in targets
+                  if (p, t) not in known)
+
+
+if __name__ == "__main__":
+    report = check_site(sys.argv[1] if len(sys.argv) > 1 else ".")
+    for page, targets in sorted(report["broken"].items()):
+        for target in targets:
+            print(f"BROKEN       {page} -> {target}")
+    for path in report["unreferenced"]:
+        print(f"UNREFERENCED {path}")
+    broken_count = sum(len(t) for t in report["broken"].values())
+    print(f"{len(report['graph'])} pages, {broken_count} broken references, "
+          f"{len(report['unreferenced'])} unreferenced assets")
+    sys.exit(1 if broken_count else 0)
@@ -4,17 +4,46 @@ from bs4 import BeautifulSoup
 import os
 import shutil
 import uuid
+import hashlib
+import time
+import json
+import itertools
 import webbrowser
 import subprocess
 import platform
-
-HTML_FILE = "notice.html"
+import sys
+from link_checker import new_broken_links
+from notice_exports import (LEGACY_NOTICE_STORE, NOTICE_PAGE, NOTICE_STORE, content_text, legacy_notice_id,
+                            notice_rows, row_html, row_payload)
+from notice_feed import update_feed
+from notice_pages import update_notice_pages
+from site_build import run_site_build
+from site_publish import load_json, save_json, serialize_html
+
+HTML_FILE = NOTICE_STORE
 UPLOAD_FOLDER = "notices"
+SEARCH_PAGE_SIZE = 20
+ADMIN_STATE_FOLDER = ".notice_admin"
+OPLOG_FILE = os.path.join(ADMIN_STATE_FOLDER, f"oplog-{platform.node() or 'local'}.jsonl")
+TRASH_FOLDER = os.path.join(ADMIN_STATE_FOLDER, "trash")
+# Attachments of scheduled notices wait here, outside the published tree
+PENDING_FOLDER = os.path.join(ADMIN_STATE_FOLDER, "pending")
+LOCK_FILE = HTML_FILE + ".lock"
+SCHEDULE_FILE = os.path.join(ADMIN_STATE_FOLDER, "schedule.json")
+SCHEDULE_TIME_FORMAT = "%Y-%m-%d %H:%M"
+SCHEDULE_POLL_MS = 10 * 60 * 1000
+MAX_UNDO_STEPS = 100
+OPLOG_COMPACT_LINES = 500
 
 selected_notice = None
+selected_notice_base = None
+loaded_table_version = None
 current_file_path = None
 search_mode = "title"
 is_maximized = True
+schedule_timer = None
+editing_scheduled = None
+headless = False
 
 # -------------------- Global Scaling Configuration --------------------
 SCALING_SETTINGS = {
@@ -71,11 +100,8 @@ class ResponsiveConfig:
         scaled_size = base_size * self.scale_factor * 0.85 * SCALING_SETTINGS["font_scale"]
         return max(int(scaled_size), 9)
 
-# Initialize responsive config early
-temp_root = tk.Tk()
-temp_root.withdraw()
-resp = ResponsiveConfig(temp_root)
-temp_root.destroy()
+# Created with the main window, so importing this module needs no display
+resp = None
 
 # -------------------- Scaling Settings Dialog --------------------
 def show_scaling_dialog():
@@ -239,6 +265,7 @@ def create_main_ui():
     """Create the main UI with current scaling settings"""
     global main_container, header, content_frame, left_column, right_column, status_bar
     global entry_title, text_content, entry_date, entry_badge, file_info_label, remove_file_btn
+    global entry_publish_at, entry_expire_at
     global count_label, status_label, notices_canvas_frame, notices_canvas
     
     # Main container with reduced padding for 1366x768
@@ -405,6 +432,25 @@ def create_main_ui():
         font=("Segoe UI", resp.font_size(8))
     ).pack(anchor="w")
 
+    # Schedule
+    create_form_label("Publish At (Optional)").pack(fill="x", 
+                                                   pady=(resp.scale(12, "padding"), resp.scale(4, "padding")))
+    entry_publish_at = create_form_entry()
+    entry_publish_at.pack(fill="x", pady=(0, resp.scale(4, "padding")), 
+                         ipady=resp.scale(6, "input"))
+    create_form_label("Expire At (Optional)").pack(fill="x", 
+                                                  pady=(resp.scale(8, "padding"), resp.scale(4, "padding")))
+    entry_expire_at = create_form_entry()
+    entry_expire_at.pack(fill="x", pady=(0, resp.scale(4, "padding")), 
+                        ipady=resp.scale(6, "input"))
+    tk.Label(
+        form_scrollable,
+        text="Format: YYYY-MM-DD HH:MM (AD, local time) | blank = now / never",
+        bg=COLORS["white"],
+        fg=COLORS["text_light"],
+        font=("Segoe UI", resp.font_size(8))
+    ).pack(anchor="w")
+
     # File Upload Section
     create_form_label("Attach File (Optional)").pack(fill="x", 
                                                     pady=(resp.scale(20, "padding"), resp.scale(4, "padding")))
@@ -458,6 +504,9 @@ def create_main_ui():
         ("🗑 Delete", remove_notice, COLORS["danger"]),
         ("🔄 Refresh", refresh_notices_list, COLORS["info"]),
         ("🧹 Clear", clear_form, COLORS["text_secondary"]),
+        ("↩ Undo", undo_last_change, COLORS["dark_light"]),
+        ("↪ Redo", redo_last_change, COLORS["dark_light"]),
+        ("🕒 Scheduled", show_schedule_dialog, COLORS["primary_dark"]),
     ]
 
     for i, (text, command, color) in enumerate(buttons):
@@ -646,9 +695,15 @@ def ensure_upload_folder():
     if not os.path.exists(UPLOAD_FOLDER):
         os.makedirs(UPLOAD_FOLDER)
 
-def save_uploaded_file(file_path):
-    """Save uploaded file to notices folder and return the relative path"""
+def save_uploaded_file(file_path, pending=False):
+    """Save uploaded file to notices folder and return the relative path.
+    
+    A `pending` file (for a notice scheduled later) is staged in PENDING_FOLDER
+    under the same name and only moved to its returned path on publish.
+    """
     ensure_upload_folder()
+    folder = PENDING_FOLDER if pending else UPLOAD_FOLDER
+    os.makedirs(folder, exist_ok=True)
     
     if not file_path or not os.path.exists(file_path):
         return ""
@@ -657,7 +712,7 @@ def save_uploaded_file(file_path):
     original_name = os.path.splitext(os.path.basename(file_path))[0]
     safe_name = "".join(c for c in original_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
     unique_filename = f"{safe_name}_{uuid.uuid4().hex[:8]}{file_ext}"
-    destination_path = os.path.join(UPLOAD_FOLDER, unique_filename)
+    destination_path = os.path.join(folder, unique_filename)
     
     try:
         shutil.copy2(file_path, destination_path)
@@ -667,6 +722,13 @@ def save_uploaded_file(file_path):
         messagebox.showerror("Upload Error", f"Failed to save file: {str(e)}")
         return ""
 
+def show_error(title, message):
+    """Report an error in a dialog, or on stderr when running without the UI"""
+    if headless:
+        print(f"{title}: {message}", file=sys.stderr)
+    else:
+        messagebox.showerror(title, message)
+
 def open_file(file_path):
     """Open file using default system application"""
     if not file_path or not os.path.exists(file_path):
@@ -692,56 +754,46 @@ def open_file(file_path):
             messagebox.showerror("Error", f"Cannot open file: {str(e)}")
             return False
 
-def load_table():
-    try:
-        if not os.path.exists(HTML_FILE):
-            with open(HTML_FILE, "w", encoding="utf-8") as f:
-                f.write("""<!DOCTYPE html>
+STORE_TEMPLATE = """<!DOCTYPE html>
 <html>
 <head>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    <style>
-        .badge { 
-            padding: 4px 12px; 
-            border-radius: 20px; 
-            font-size: 12px; 
-            font-weight: bold; 
-            display: inline-flex;
-            align-items: center;
-            gap: 4px;
-        }
-        .bg-red-100 { background-color: #fee2e2; } .text-red-800 { color: #991b1b; }
-        .bg-blue-100 { background-color: #dbeafe; } .text-blue-800 { color: #1e40af; }
-        .bg-green-100 { background-color: #d1fae5; } .text-green-800 { color: #065f46; }
-        .bg-yellow-100 { background-color: #fef3c7; } .text-yellow-800 { color: #92400e; }
-        .bg-gray-100 { background-color: #f3f4f6; } .text-gray-800 { color: #374151; }
-        .notice-content { 
-            margin-bottom: 10px; 
-            line-height: 1.5;
-        }
-        .download-link { 
-            margin-right: 12px; 
-            display: inline-flex;
-            align-items: center;
-            gap: 6px;
-            text-decoration: none;
-            transition: color 0.2s;
-        }
-        .download-link:hover {
-            color: #3b82f6;
-        }
-    </style>
+    <meta charset="utf-8">
+    <title>Notice data</title>
 </head>
 <body>
+    <!-- Managed by notice_admin.py and never published: notice.html loads notices.json, built from this table -->
     <table id="noticeTable">
         <thead><tr><th>Title</th><th>Content</th><th>Date</th></tr></thead>
         <tbody></tbody>
     </table>
 </body>
-</html>""")
+</html>"""
+
+def create_notice_store():
+    """Start the data file: move in the old served copy, or carry over rows still embedded in notice.html"""
+    os.makedirs(os.path.dirname(HTML_FILE), exist_ok=True)
+    if os.path.exists(LEGACY_NOTICE_STORE):
+        os.replace(LEGACY_NOTICE_STORE, HTML_FILE)
+        return
+    soup = BeautifulSoup(STORE_TEMPLATE, "html.parser")
+    tbody = soup.find("tbody")
+    for row in notice_rows(NOTICE_PAGE):
+        if not row.get("data-id"):
+            row["data-id"] = legacy_notice_id(row)
+        tbody.append(row.extract())
+    with open(HTML_FILE, "w", encoding="utf-8") as f:
+        f.write(serialize_html(soup))
+
+def load_table():
+    try:
+        if not os.path.exists(HTML_FILE):
+            create_notice_store()
             
-        with open(HTML_FILE, "r", encoding="utf-8") as file:
-            soup = BeautifulSoup(file, "html.parser")
+        global loaded_table_version
+        with open(HTML_FILE, "rb") as file:
+            raw = file.read()
+        loaded_table_version = hashlib.sha256(raw).hexdigest()
+        soup = BeautifulSoup(raw.decode("utf-8"), "html.parser")
         
         table = soup.find("table", id="noticeTable")
         if not table:
@@ -762,157 +814,322 @@ def load_table():
         if not tbody:
             tbody = soup.new_tag("tbody")
             table.append(tbody)
+        
+        for row in tbody.find_all("tr"):
+            if not row.get("data-id"):
+                row["data-id"] = legacy_notice_id(row)
             
         return soup, tbody
     except Exception as e:
-        messagebox.showerror("Error", f"Failed to load HTML: {str(e)}")
+        show_error("Error", f"Failed to load HTML: {str(e)}")
         return None
 
-def save_table(soup):
+def save_table(soup, changes=()):
+    """Write the notice store and return the links this save newly leaves broken (None if it failed).
+    
+    `changes` are the (before, after) row payloads behind the save; their
+    feed entries and notice pages are patched once the store is written.
+    """
+    html = serialize_html(soup) if soup else ""
+    try:
+        tmp_path = HTML_FILE + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            file.write(html)
+        os.replace(tmp_path, HTML_FILE)
+    except Exception as e:
+        show_error("Error", f"Failed to save: {str(e)}")
+        return None
+    
+    tbody = soup.find("tbody") if soup else None
+    for before, after in changes:
+        update_notice_outputs(tbody, before, after)
+    
+    # The store is saved either way; a failed build is retried by the next one
+    try:
+        run_site_build()
+    except Exception as e:
+        show_error("Build Error", f"✅ Notices saved, but the public files were not rebuilt:\n{e}\n\n"
+                                  "Run 'python site_build.py' to retry.")
+    
+    # Checked after the build, so notices.json and the notice pages are current
     try:
-        with open(HTML_FILE, "w", encoding="utf-8") as file:
-            file.write(str(soup.prettify() if soup else ""))
+        return new_broken_links()
     except Exception as e:
-        messagebox.showerror("Error", f"Failed to save: {str(e)}")
+        print(f"Link check error: {e}")
+        return []
+
+def warn_broken_links(broken_links):
+    """Show the links a save left pointing at missing files"""
+    lines = "\n".join(f"{page} → {target}" for page, target in broken_links[:10])
+    if len(broken_links) > 10:
+        lines += f"\n... and {len(broken_links) - 10} more"
+    messagebox.showwarning("Broken Links", f"🔗 These links now point at missing files:\n{lines}")
+
+def new_notice_id():
+    return uuid.uuid4().hex[:12]
 
-def create_row(title, content, date_bs, badge, badge_class, file_link):
-    year, month, day = date_bs.split("/")
-    sort_date = f"{year}{month.zfill(2)}{day.zfill(2)}"
+def create_row(title, content, date_bs, badge, badge_class, file_link, notice_id=None):
+    payload = {"id": notice_id or new_notice_id(), "title": title, "content": content, "date": date_bs,
+               "badge": badge, "badge_class": badge_class, "file_link": file_link}
+    return BeautifulSoup(row_html(payload), "html.parser").tr
+
+def find_notice_row(tbody, title, date_bs):
+    for row in tbody.find_all("tr"):
+        title_cell = row.find("td", {"data-label": "Title"})
+        date_cell = row.find("td", {"data-label": "Date"})
+        if title_cell and date_cell:
+            if title_cell.text.strip() == title and date_cell.get("data-date", "").strip() == date_bs:
+                return row
+    return None
+
+def find_notice_row_by_id(tbody, notice_id):
+    return tbody.find("tr", attrs={"data-id": notice_id})
+
+def row_hash(tbody, notice_id):
+    """Hash of a stored row's payload, or None when no row has this ID"""
+    row = find_notice_row_by_id(tbody, notice_id)
+    if row is None:
+        return None
+    payload = json.dumps(row_payload(row), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+def apply_notice_change(tbody, before, after, index=None):
+    """Replace the row described by `before` with one built from `after`.
     
-    file_name = os.path.basename(file_link) if file_link else ""
+    Either side may be None (insert / delete). Attachments that are no longer
+    referenced go to the trash folder and referenced ones are restored from it.
+    Returns the position of the affected row, or None if `before` was not found.
+    """
+    position = 0 if index is None else index
     
-    badge_icon = ""
-    if badge.lower() == "urgent":
-        badge_icon = "🔥"
-    elif badge.lower() == "important":
-        badge_icon = "⭐"
-    elif badge.lower() == "holiday":
-        badge_icon = "🎉"
-    else:
-        badge_icon = "📌"
-    
-    row_html = f"""
-<tr>
-<td class="font-medium text-gray-900" data-label="Title">{title}</td>
-<td class="text-gray-700" data-label="Content">
-    <div class="notice-content">{content}</div>
-    {"<a href='" + file_link + "' target='_blank' class='download-link text-blue-600'><i class='fas fa-paperclip'></i> " + file_name + "</a>" if file_link else ""}
-    <span class="badge {badge_class}">{badge_icon} {badge}</span>
-</td>
-<td class="text-gray-600" data-label="Date" data-sort="{sort_date}" data-date="{date_bs}">
-    <div class="font-medium"><i class="far fa-calendar-alt"></i> {date_bs}</div>
-</td>
-</tr>
-"""
-    return BeautifulSoup(row_html, "html.parser").tr
-
-def insert_notice(title, content, date_bs, badge, badge_class, file_link):
-    result = load_table()
-    if not result:
-        return False
-    soup, tbody = result
-    new_row = create_row(title, content, date_bs, badge, badge_class, file_link)
-    tbody.insert(0, new_row)
-    save_table(soup)
-    return True
+    if before:
+        if before.get("id"):
+            row = find_notice_row_by_id(tbody, before["id"])
+        else:
+            row = find_notice_row(tbody, before["title"], before["date"])
+        if row is None:
+            return None
+        position = tbody.find_all("tr").index(row)
+        row.decompose()
+        
+        old_file = before.get("file_link", "")
+        if old_file and (not after or after.get("file_link", "") != old_file):
+            trash_attachment(old_file)
+    
+    if after:
+        if after.get("file_link"):
+            restore_attachment(after["file_link"])
+        
+        new_row = create_row(after["title"], after["content"], after["date"],
+                             after["badge"], after["badge_class"], after["file_link"], after.get("id"))
+        rows = tbody.find_all("tr")
+        if position < len(rows):
+            rows[position].insert_before(new_row)
+        else:
+            tbody.append(new_row)
+    
+    return position
+
+def update_notice_outputs(tbody, before, after):
+    """Patch notices.xml and the notice's permalink page; a problem there never blocks the save"""
+    try:
+        update_feed(before, after, lambda: [row_payload(row) for row in tbody.find_all("tr")])
+    except Exception as e:
+        print(f"Feed update error: {e}")
+    try:
+        update_notice_pages(before, after)
+    except Exception as e:
+        print(f"Notice page update error: {e}")
+
+class NoticeFileLock:
+    """Advisory lock file held around writes to the notice store.
+    
+    Only writers take the lock; readers rely on save_table replacing the file
+    atomically. A lock left behind by a crashed workstation is broken once it
+    is older than `stale_after` seconds: it is renamed to a unique name first,
+    so of several workstations seeing the same stale lock only one removes it.
+    """
+    def __init__(self, path, timeout=10, stale_after=60):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+    
+    def __enter__(self):
+        deadline = time.time() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                with os.fdopen(fd, "w") as f:
+                    f.write(f"{platform.node()} {os.getpid()}")
+                return self
+            except FileExistsError:
+                try:
+                    stat = os.stat(self.path)
+                    if time.time() - stat.st_mtime > self.stale_after:
+                        self.break_stale(stat)
+                        continue
+                except OSError:
+                    continue
+                if time.time() > deadline:
+                    raise TimeoutError(f"{self.path} is held by another workstation")
+                time.sleep(0.1)
+    
+    def break_stale(self, stat):
+        """Remove the lock last seen as `stat`, unless another workstation replaced it meanwhile"""
+        stale_path = f"{self.path}.{uuid.uuid4().hex}.stale"
+        os.rename(self.path, stale_path)
+        moved = os.stat(stale_path)
+        if (moved.st_ino, moved.st_mtime_ns) != (stat.st_ino, stat.st_mtime_ns):
+            # Broken and re-taken by someone else between our stat and rename: hand it back
+            os.replace(stale_path, self.path)
+            return
+        os.remove(stale_path)
+    
+    def __exit__(self, *exc):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+def commit_notice_change(kind, before, after, index=None, base_version=None, record=True, expected_hash=None):
+    """Apply one row change to the latest notice store under the write lock.
+    
+    If the store changed since `base_version` (another workstation saved),
+    the change is merged onto the fresh table by notice ID as long as that
+    notice itself still matches `before`. Undo and redo pass the row hash
+    the operation log recorded for `before` as `expected_hash` instead.
+    Returns the row position, or None when the notice is gone or was edited
+    elsewhere.
+    """
+    try:
+        with NoticeFileLock(LOCK_FILE):
+            result = load_table()
+            if not result:
+                return None
+            soup, tbody = result
+            
+            if before and base_version and base_version != loaded_table_version:
+                row = find_notice_row_by_id(tbody, before["id"]) if before.get("id") else None
+                if row is None or row_payload(row) != before:
+                    return None
+            if before and expected_hash and row_hash(tbody, before["id"]) != expected_hash:
+                return None
+            # Re-inserting a notice (undo of a delete) must not duplicate one that is back already
+            if after and not before and row_hash(tbody, after["id"]) is not None:
+                return None
+            
+            before_hash = row_hash(tbody, before["id"]) if before else None
+            position = apply_notice_change(tbody, before, after, index)
+            if position is None:
+                return None
+            after_hash = row_hash(tbody, after["id"]) if after else None
+            broken_links = save_table(soup, [(before, after)])
+            if broken_links is None:
+                return None
+    except TimeoutError as e:
+        show_error("Busy", f"⏳ Notice file is locked by another workstation.\n{e}")
+        return None
+    
+    if broken_links:
+        warn_broken_links(broken_links)
+    
+    if record:
+        operation_log.record(kind, before, after, position, before_hash, after_hash)
+    return position
+
+def edited_content(text, stored):
+    """Content to save for a notice whose text the form shows as `text`.
+    
+    The form edits plain text; while it still reads as the stored content,
+    the stored markup is kept instead of the flattened text.
+    """
+    return stored if text == content_text(stored) else text
+
+def notice_payload(title, content, date_bs, badge, badge_class, file_link, notice_id=None):
+    return {"id": notice_id or new_notice_id(), "title": title, "content": content, "date": date_bs,
+            "badge": badge, "badge_class": badge_class, "file_link": file_link}
 
-def find_notice(search_term, search_by="title"):
+def insert_notice(title, content, date_bs, badge, badge_class, file_link, notice_id=None):
+    after = notice_payload(title, content, date_bs, badge, badge_class, file_link, notice_id)
+    return commit_notice_change("insert", None, after, 0) is not None
+
+def _match_rank(value, search_term):
+    """Rank a field match: 0 exact, 1 prefix, 2 word start, 3 substring, None if absent"""
+    value = value.lower()
+    term = search_term.lower()
+    position = value.find(term)
+    if position < 0:
+        return None
+    if value == term:
+        return 0
+    if position == 0:
+        return 1
+    if not value[position - 1].isalnum():
+        return 2
+    return 3
+
+def iter_notice_matches(search_term, search_by="title"):
+    """Yield lightweight match summaries, best ranked first and newest first within a rank"""
     result = load_table()
     if not result:
-        return []
+        return
     _, tbody = result
-    rows = tbody.find_all("tr")
-    matches = []
-    
-    for row in rows:
+
+    buckets = ([], [], [], [])
+    for row in tbody.find_all("tr"):
+        title_cell = row.find("td", {"data-label": "Title"})
+        date_cell = row.find("td", {"data-label": "Date"})
+        badge_span = row.find("span", class_="badge")
+        if not title_cell or not date_cell:
+            continue
+
+        title = title_cell.text.strip()
+        date = date_cell.get("data-date", "").strip()
+        badge = badge_span.text.strip() if badge_span else ""
+
         if search_by == "title":
-            title_cell = row.find("td", {"data-label": "Title"})
-            if title_cell:
-                title = title_cell.text.strip()
-                if search_term.lower() in title.lower():
-                    matches.append(row)
+            rank = _match_rank(title, search_term)
         elif search_by == "date":
-            date_cell = row.find("td", {"data-label": "Date"})
-            if date_cell:
-                date = date_cell.get("data-date", "").strip()
-                if search_term in date:
-                    matches.append(row)
+            rank = _match_rank(date, search_term)
         elif search_by == "badge":
-            badge_span = row.find("span", class_="badge")
-            if badge_span:
-                badge = badge_span.text.strip()
-                if search_term.lower() in badge.lower():
-                    matches.append(row)
+            rank = _match_rank(badge, search_term)
         elif search_by == "content":
             content_div = row.find("div", class_="notice-content")
-            if content_div:
-                content = content_div.text.strip()
-                if search_term.lower() in content.lower():
-                    matches.append(row)
-    
-    return matches
+            rank = _match_rank(content_div.text.strip(), search_term) if content_div else None
+        else:
+            rank = None
 
-def delete_notice_by_identifier(title, date_bs):
+        if rank is not None:
+            buckets[rank].append({"title": title, "date": date, "badge": badge})
+
+    for bucket in buckets:
+        bucket.sort(key=lambda x: x["date"], reverse=True)
+        yield from bucket
+
+def resolve_notice(title, date_bs):
+    """Read the current payload of a notice without taking the write lock"""
     result = load_table()
     if not result:
+        return None, None
+    _, tbody = result
+    row = find_notice_row(tbody, title, date_bs)
+    if row is None:
+        return None, None
+    return row_payload(row), loaded_table_version
+
+def delete_notice_by_identifier(title, date_bs, base=None):
+    before, version = base or resolve_notice(title, date_bs)
+    if not before:
         return False
-    soup, tbody = result
-    rows = tbody.find_all("tr")
-    for row in rows:
-        title_cell = row.find("td", {"data-label": "Title"})
-        date_cell = row.find("td", {"data-label": "Date"})
-        
-        if title_cell and date_cell:
-            t = title_cell.text.strip()
-            d = date_cell.get("data-date", "").strip()
-            if t == title and d == date_bs:
-                download_link = row.find("a", class_="download-link")
-                if download_link:
-                    file_path = download_link.get("href", "")
-                    if file_path:
-                        if not os.path.isabs(file_path):
-                            file_path = os.path.abspath(file_path)
-                        if os.path.exists(file_path):
-                            try:
-                                os.remove(file_path)
-                            except Exception as e:
-                                print(f"Error deleting file: {e}")
-                row.decompose()
-                save_table(soup)
-                return True
-    return False
-
-def update_notice_by_identifier(old_title, old_date, new_title, content, date_bs, badge, badge_class, file_link):
-    result = load_table()
-    if not result:
+    return commit_notice_change("delete", before, None, base_version=version) is not None
+
+def update_notice_by_identifier(old_title, old_date, new_title, content, date_bs, badge, badge_class, file_link, base=None):
+    before, version = base or resolve_notice(old_title, old_date)
+    if not before:
         return False
-    soup, tbody = result
-    rows = tbody.find_all("tr")
-    for row in rows:
-        title_cell = row.find("td", {"data-label": "Title"})
-        date_cell = row.find("td", {"data-label": "Date"})
-        
-        if title_cell and date_cell:
-            t = title_cell.text.strip()
-            d = date_cell.get("data-date", "").strip()
-            if t == old_title and d == old_date:
-                download_link = row.find("a", class_="download-link")
-                if download_link:
-                    old_file_path = download_link.get("href", "")
-                    if old_file_path and file_link != old_file_path:
-                        if not os.path.isabs(old_file_path):
-                            old_file_path = os.path.abspath(old_file_path)
-                        if os.path.exists(old_file_path):
-                            try:
-                                os.remove(old_file_path)
-                            except Exception as e:
-                                print(f"Error deleting old file: {e}")
-                
-                new_row = create_row(new_title, content, date_bs, badge, badge_class, file_link)
-                row.replace_with(new_row)
-                save_table(soup)
-                return True
-    return False
+    after = {"id": before["id"], "title": new_title, "content": content, "date": date_bs,
+             "badge": badge, "badge_class": badge_class, "file_link": file_link}
+    return commit_notice_change("update", before, after, base_version=version) is not None
 
 def get_all_notices():
     result = load_table()
@@ -965,6 +1182,339 @@ def get_notice_file(title, date_bs):
             return notice.get("file_link", "")
     return ""
 
+# -------------------- Operation Log (Undo / Redo) --------------------
+class OperationLog:
+    """Append-only log of notice changes with an undo/redo cursor.
+    
+    Every insert, update and delete is appended as a "do" line holding the row
+    payload before and after the change; undo and redo append a one-word line
+    that moves the cursor. Replaying the file at startup rebuilds the stack, and
+    each undo or redo step is a single row change against the notice store.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.entries = []
+        self.cursor = 0
+        self.line_count = 0
+        self.loaded = False
+    
+    def load(self):
+        self.entries, self.cursor, self.line_count = [], 0, 0
+        self.loaded = True
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                self._replay(event)
+                self.line_count += 1
+    
+    def _replay(self, event):
+        if event["op"] == "do":
+            del self.entries[self.cursor:]
+            self.entries.append(event)
+            self.cursor += 1
+        elif event["op"] == "undo" and self.cursor > 0:
+            self.cursor -= 1
+        elif event["op"] == "redo" and self.cursor < len(self.entries):
+            self.cursor += 1
+    
+    def _append(self, event):
+        if not self.loaded:
+            self.load()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        self._replay(event)
+        self.line_count += 1
+        if self.line_count > OPLOG_COMPACT_LINES:
+            self.compact()
+    
+    def record(self, kind, before, after, index=None, before_hash=None, after_hash=None):
+        """Log a change; the hashes are of the stored rows, checked before undo / redo"""
+        self._append({"op": "do", "kind": kind, "before": before, "after": after, "index": index,
+                      "before_hash": before_hash, "after_hash": after_hash})
+    
+    def mark(self, op):
+        self._append({"op": op})
+    
+    def peek_undo(self):
+        if not self.loaded:
+            self.load()
+        return self.entries[self.cursor - 1] if self.cursor > 0 else None
+    
+    def peek_redo(self):
+        if not self.loaded:
+            self.load()
+        return self.entries[self.cursor] if self.cursor < len(self.entries) else None
+    
+    def compact(self):
+        """Rewrite the log as the last MAX_UNDO_STEPS entries and purge unreachable trash"""
+        keep_from = max(0, len(self.entries) - MAX_UNDO_STEPS)
+        entries = self.entries[keep_from:]
+        cursor = max(0, self.cursor - keep_from)
+        
+        lines = [json.dumps(entry, ensure_ascii=False) for entry in entries]
+        lines += [json.dumps({"op": "undo"})] * (len(entries) - cursor)
+        
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("".join(line + "\n" for line in lines))
+        os.replace(tmp_path, self.path)
+        
+        self.entries, self.cursor, self.line_count = entries, cursor, len(lines)
+        
+        # The trash is shared by every workstation's log, so keep anything any of them can reach
+        referenced = set()
+        for name in os.listdir(os.path.dirname(self.path)):
+            if not (name.startswith("oplog") and name.endswith(".jsonl")):
+                continue
+            with open(os.path.join(os.path.dirname(self.path), name), "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        continue
+                    for payload in (event.get("before"), event.get("after")):
+                        if payload and payload.get("file_link"):
+                            referenced.add(os.path.basename(payload["file_link"]))
+        if os.path.isdir(TRASH_FOLDER):
+            for name in os.listdir(TRASH_FOLDER):
+                if name not in referenced:
+                    try:
+                        os.remove(os.path.join(TRASH_FOLDER, name))
+                    except OSError as e:
+                        print(f"Error purging trash: {e}")
+
+operation_log = OperationLog(OPLOG_FILE)
+
+def trash_attachment(file_link):
+    """Move an attachment into the trash folder instead of deleting it"""
+    if not file_link or not os.path.exists(file_link):
+        return
+    os.makedirs(TRASH_FOLDER, exist_ok=True)
+    try:
+        shutil.move(file_link, os.path.join(TRASH_FOLDER, os.path.basename(file_link)))
+    except Exception as e:
+        print(f"Error moving file to trash: {e}")
+
+def restore_attachment(file_link):
+    """Move an attachment back from the trash folder if it is missing"""
+    trashed = os.path.join(TRASH_FOLDER, os.path.basename(file_link))
+    if os.path.exists(file_link) or not os.path.exists(trashed):
+        return
+    os.makedirs(os.path.dirname(file_link) or ".", exist_ok=True)
+    try:
+        shutil.move(trashed, file_link)
+    except Exception as e:
+        print(f"Error restoring file from trash: {e}")
+
+def undo_last_change():
+    entry = operation_log.peek_undo()
+    if not entry:
+        status_label.config(text="↩ Nothing to undo", fg=COLORS["text_secondary"])
+        return
+    
+    if commit_notice_change(entry["kind"], entry["after"], entry["before"], entry.get("index"), record=False,
+                            expected_hash=entry.get("after_hash")) is None:
+        messagebox.showerror("Undo", "❌ The notice was changed since this step and cannot be undone")
+        return
+    operation_log.mark("undo")
+    
+    clear_form()
+    refresh_notices_list()
+    update_count()
+    status_label.config(text=f"↩ Undid {entry['kind']} of '{(entry['before'] or entry['after'])['title']}'", fg=COLORS["info"])
+
+def redo_last_change():
+    entry = operation_log.peek_redo()
+    if not entry:
+        status_label.config(text="↪ Nothing to redo", fg=COLORS["text_secondary"])
+        return
+    
+    if commit_notice_change(entry["kind"], entry["before"], entry["after"], entry.get("index"), record=False,
+                            expected_hash=entry.get("before_hash")) is None:
+        messagebox.showerror("Redo", "❌ The notice was changed since this step and cannot be redone")
+        return
+    operation_log.mark("redo")
+    
+    clear_form()
+    refresh_notices_list()
+    update_count()
+    status_label.config(text=f"↪ Redid {entry['kind']} of '{(entry['after'] or entry['before'])['title']}'", fg=COLORS["info"])
+
+# -------------------- Scheduled Publish / Expiry --------------------
+def parse_schedule_time(text):
+    """Normalize a 'YYYY-MM-DD HH:MM' (or date-only) local time; blank means unscheduled"""
+    text = text.strip()
+    if not text:
+        return ""
+    for fmt in (SCHEDULE_TIME_FORMAT, "%Y-%m-%d"):
+        try:
+            return time.strftime(SCHEDULE_TIME_FORMAT, time.strptime(text, fmt))
+        except ValueError:
+            continue
+    raise ValueError(f"Not a schedule time: {text}")
+
+def load_schedule():
+    """Pending transitions: {"id", "action": "publish" | "expire", "at"[, "notice"]}"""
+    return load_json(SCHEDULE_FILE, [])
+
+def save_schedule(entries):
+    # Normalized times sort chronologically as strings
+    save_json(SCHEDULE_FILE, sorted(entries, key=lambda entry: (entry["at"], entry["id"])))
+
+def scheduled_at(notice_id, action):
+    for entry in load_schedule():
+        if entry["id"] == notice_id and entry["action"] == action:
+            return entry["at"]
+    return ""
+
+def set_schedule(notice_id, expire_at, publish_at="", notice=None):
+    """Replace every pending transition of one notice; blank times cancel them"""
+    try:
+        with NoticeFileLock(LOCK_FILE):
+            entries = [entry for entry in load_schedule() if entry["id"] != notice_id]
+            if publish_at:
+                entries.append({"id": notice_id, "action": "publish", "at": publish_at, "notice": notice})
+            if expire_at:
+                entries.append({"id": notice_id, "action": "expire", "at": expire_at})
+            save_schedule(entries)
+    except TimeoutError as e:
+        show_error("Busy", f"⏳ Notice file is locked by another workstation.\n{e}")
+        return False
+    return True
+
+def cancel_schedule(notice_id):
+    """Drop a notice's pending transitions; an unpublished notice's staged attachment goes too"""
+    notice = next((entry["notice"] for entry in load_schedule()
+                   if entry["id"] == notice_id and entry["action"] == "publish"), None)
+    if not set_schedule(notice_id, ""):
+        return False
+    if notice:
+        discard_pending_attachment(notice["file_link"])
+    return True
+
+def pending_attachment(file_link):
+    return os.path.join(PENDING_FOLDER, os.path.basename(file_link))
+
+def release_pending_attachment(file_link):
+    """Move a scheduled notice's staged attachment to its published path"""
+    staged = pending_attachment(file_link) if file_link else ""
+    if not staged or os.path.exists(file_link) or not os.path.exists(staged):
+        return
+    os.makedirs(os.path.dirname(file_link) or ".", exist_ok=True)
+    try:
+        shutil.move(staged, file_link)
+    except Exception as e:
+        print(f"Error publishing staged file: {e}")
+
+def discard_pending_attachment(file_link):
+    if file_link:
+        try:
+            os.remove(pending_attachment(file_link))
+        except OSError:
+            pass
+
+def apply_due_schedule(now=None):
+    """Apply every due publish and expiry in one locked write of the notice store.
+    
+    Publishing inserts the stored notice at the top unless its ID is already
+    live; expiring deletes the row (its attachment goes to the trash, so the
+    step can be undone like any other). Entries whose notice is gone are
+    dropped. Returns the applied changes as logged (kind, before, after,
+    index, before_hash, after_hash) and the links the save newly left broken.
+    Raises TimeoutError while another workstation holds the lock and OSError
+    when the notice store cannot be read or written (the due entries are
+    then kept for the next run).
+    """
+    now = now or time.strftime(SCHEDULE_TIME_FORMAT)
+    changes, broken_links = [], []
+    with NoticeFileLock(LOCK_FILE):
+        entries = load_schedule()
+        due = [entry for entry in entries if entry["at"] <= now]
+        if not due:
+            return changes, broken_links
+        result = load_table()
+        if not result:
+            raise OSError(f"Could not read {HTML_FILE}")
+        soup, tbody = result
+        
+        expired_ids = set()
+        for entry in due:
+            row = find_notice_row_by_id(tbody, entry["id"])
+            if entry["action"] == "publish" and row is None:
+                if entry["id"] in expired_ids:
+                    discard_pending_attachment(entry["notice"]["file_link"])
+                    continue
+                release_pending_attachment(entry["notice"]["file_link"])
+                apply_notice_change(tbody, None, entry["notice"], 0)
+                changes.append(("insert", None, entry["notice"], 0, None, row_hash(tbody, entry["id"])))
+            elif entry["action"] == "expire":
+                expired_ids.add(entry["id"])
+                if row is not None:
+                    before = row_payload(row)
+                    before_hash = row_hash(tbody, entry["id"])
+                    position = apply_notice_change(tbody, before, None)
+                    changes.append(("delete", before, None, position, before_hash, None))
+        
+        if changes:
+            broken_links = save_table(soup, [(before, after) for _, before, after, *_ in changes])
+            if broken_links is None:
+                raise OSError(f"Could not write {HTML_FILE}")
+        # An expired notice must not come back through a later publish entry
+        save_schedule([entry for entry in entries
+                       if entry not in due and entry["id"] not in expired_ids])
+    
+    for change in changes:
+        operation_log.record(*change)
+    return changes, broken_links
+
+def schedule_next_check(delay=None):
+    """Keep a single timer armed for the next due transition.
+    
+    The timer also fires every SCHEDULE_POLL_MS so entries added by another
+    workstation are picked up.
+    """
+    global schedule_timer
+    if schedule_timer is not None:
+        root.after_cancel(schedule_timer)
+    if delay is None:
+        delay = SCHEDULE_POLL_MS
+        upcoming = [entry["at"] for entry in load_schedule()]
+        if upcoming:
+            due_in = time.mktime(time.strptime(min(upcoming), SCHEDULE_TIME_FORMAT)) - time.time()
+            delay = max(0, min(delay, int(due_in * 1000) + 1000))
+    schedule_timer = root.after(delay, run_due_schedule)
+
+def run_due_schedule():
+    global schedule_timer
+    schedule_timer = None
+    try:
+        changes, broken_links = apply_due_schedule()
+    except TimeoutError:
+        schedule_next_check(30 * 1000)
+        return
+    except OSError as e:
+        status_label.config(text=f"❌ Schedule not applied: {e}", fg=COLORS["danger"])
+        schedule_next_check()
+        return
+    
+    if changes:
+        published = sum(1 for kind, *_ in changes if kind == "insert")
+        expired = len(changes) - published
+        status_label.config(text=f"🕒 Schedule applied: {published} published, {expired} expired", fg=COLORS["info"])
+        refresh_notices_list()
+    if broken_links:
+        warn_broken_links(broken_links)
+    schedule_next_check()
+
 # -------------------- Enhanced UI Functions --------------------
 def create_modern_button(parent, text, command, color=COLORS["primary"], hover_color=None):
     if hover_color is None:
@@ -1055,6 +1605,7 @@ def remove_selected_file():
 
 def submit_notice():
     global current_file_path
+    scheduled = editing_scheduled
     
     title = entry_title.get().strip()
     content = text_content.get("1.0", tk.END).strip()
@@ -1077,9 +1628,25 @@ def submit_notice():
         messagebox.showwarning("Input Error", "📅 Date must be in YYYY/MM/DD format")
         return
     
-    file_link = ""
+    try:
+        publish_at = parse_schedule_time(entry_publish_at.get())
+        expire_at = parse_schedule_time(entry_expire_at.get())
+    except ValueError:
+        messagebox.showwarning("Input Error", "🕒 Publish/Expire times must be in YYYY-MM-DD HH:MM format")
+        return
+    if expire_at and expire_at <= max(publish_at, time.strftime(SCHEDULE_TIME_FORMAT)):
+        messagebox.showwarning("Input Error", "🕒 Expire time must be after the notice goes live")
+        return
+    
+    if scheduled and not scheduled_at(scheduled["id"], "publish"):
+        messagebox.showwarning("Scheduled", "🕒 This notice has already been published; edit it from the notice list")
+        clear_form()
+        return
+    
+    goes_live_later = publish_at > time.strftime(SCHEDULE_TIME_FORMAT)
+    file_link = scheduled["file_link"] if scheduled else ""
     if current_file_path:
-        file_link = save_uploaded_file(current_file_path)
+        file_link = save_uploaded_file(current_file_path, pending=goes_live_later)
         if not file_link:
             return
     
@@ -1093,7 +1660,29 @@ def submit_notice():
     else:
         badge_class = "bg-yellow-100 text-yellow-800"
     
-    if insert_notice(title, content, date_bs, badge, badge_class, file_link):
+    notice_id = scheduled["id"] if scheduled else new_notice_id()
+    if scheduled:
+        content = edited_content(content, scheduled["content"])
+    if goes_live_later:
+        notice = notice_payload(title, content, date_bs, badge, badge_class, file_link, notice_id)
+        if set_schedule(notice_id, expire_at, publish_at, notice):
+            if scheduled and scheduled["file_link"] != file_link:
+                discard_pending_attachment(scheduled["file_link"])
+            status_label.config(text=f"🕒 '{title}' will be published at {publish_at}", fg=COLORS["info"])
+            messagebox.showinfo("Scheduled", f"🕒 Notice scheduled for {publish_at}")
+            clear_form()
+            schedule_next_check()
+        return
+    
+    if scheduled:
+        if scheduled["file_link"] == file_link:
+            release_pending_attachment(file_link)
+        else:
+            discard_pending_attachment(scheduled["file_link"])
+    if insert_notice(title, content, date_bs, badge, badge_class, file_link, notice_id):
+        # Publishing a scheduled notice early also drops its publish entry
+        if (expire_at or scheduled) and set_schedule(notice_id, expire_at):
+            schedule_next_check()
         status_label.config(text=f"✅ Notice added successfully! | {len(get_all_notices())} total notices", fg=COLORS["success"])
         
         if file_link:
@@ -1108,15 +1697,19 @@ def submit_notice():
         messagebox.showerror("Error", "❌ Failed to add notice")
 
 def clear_form():
-    global selected_notice, current_file_path
+    global selected_notice, selected_notice_base, current_file_path, editing_scheduled
     selected_notice = None
+    selected_notice_base = None
     current_file_path = None
+    editing_scheduled = None
     
     entry_title.delete(0, tk.END)
     text_content.delete("1.0", tk.END)
     entry_date.delete(0, tk.END)
     entry_badge.delete(0, tk.END)
     entry_badge.insert(0, "Normal")
+    entry_publish_at.delete(0, tk.END)
+    entry_expire_at.delete(0, tk.END)
     
     file_info_label.config(text="📁 No file selected", fg=COLORS["text_light"])
     remove_file_btn.config(state="disabled")
@@ -1187,30 +1780,32 @@ def show_search_dialog():
     enable_paste(search_entry)
     search_entry.focus()
     
-    def perform_search():
-        search_term = search_entry.get().strip()
-        if not search_term:
-            messagebox.showwarning("Search", "🔍 Please enter a search term")
-            return
-        
-        mode = search_var.get()
-        matches = find_notice(search_term, mode)
-        
-        if not matches:
-            messagebox.showinfo("Search Result", "📭 No matching notice found")
-            return
-        
+    results = {"window": None, "content": None, "canvas": None, "header": None,
+               "more_btn": None, "matches": None, "pending": None, "shown": 0}
+    
+    def load_and_close(title, date):
+        load_notice_for_editing(title, date)
+        search_window.destroy()
+    
+    def build_results_window():
         results_window = tk.Toplevel(search_window)
-        results_window.title(f"Search Results ({len(matches)} found)")
         results_window.geometry(f"{resp.scale(600)}x{resp.scale(400)}")
         results_window.configure(bg="white")
+        results_window.protocol("WM_DELETE_WINDOW", results_window.withdraw)
         
         results_header = tk.Frame(results_window, bg=COLORS["primary"], height=resp.scale(50))
         results_header.pack(fill="x")
         results_header.pack_propagate(False)
         
-        tk.Label(results_header, text=f"🔍 Found {len(matches)} result(s)", 
-                 bg=COLORS["primary"], fg="white", font=("Segoe UI", resp.font_size(12), "bold")).pack(expand=True)
+        header_label = tk.Label(results_header, bg=COLORS["primary"], fg="white",
+                                font=("Segoe UI", resp.font_size(12), "bold"))
+        header_label.pack(expand=True)
+        
+        results_footer = tk.Frame(results_window, bg="white")
+        results_footer.pack(side="bottom", fill="x", pady=(0, resp.scale(10)))
+        
+        more_btn = create_modern_button(results_footer, "⬇ Load more", show_next_page, COLORS["primary"])
+        more_btn.config(padx=resp.scale(12), pady=resp.scale(4), font=("Segoe UI", resp.font_size(9), "bold"))
         
         results_container = tk.Frame(results_window, bg="white")
         results_container.pack(fill="both", expand=True, padx=resp.scale(15), pady=resp.scale(15))
@@ -1230,46 +1825,87 @@ def show_search_dialog():
         results_canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        for i, match in enumerate(matches):
-            title = match.find("td", {"data-label": "Title"}).text.strip()
-            date = match.find("td", {"data-label": "Date"}).get("data-date", "").strip()
-            badge = match.find("span", class_="badge").text.strip()
-            
-            result_card = create_card(results_content, padx=resp.scale(12), pady=resp.scale(10))
-            result_card.pack(fill="x", padx=resp.scale(5), pady=resp.scale(5))
-            
-            header_frame = tk.Frame(result_card, bg=COLORS["card_bg"])
-            header_frame.pack(fill="x", pady=(0, resp.scale(6)))
-            
-            tk.Label(header_frame, text=f"{i+1}. {title}", bg=COLORS["card_bg"],
-                     fg=COLORS["dark"], font=("Segoe UI", resp.font_size(10), "bold")).pack(side="left")
-            
-            badge_lower = badge.lower().replace("🔥", "").replace("⭐", "").replace("🎉", "").replace("📌", "").strip()
-            badge_color, bg_color, text_color = BADGE_COLORS.get(badge_lower, (COLORS["warning"], COLORS["light"], COLORS["dark"]))
-            
-            badge_label = tk.Label(header_frame, text=badge,
-                                   bg=bg_color, fg=text_color,
-                                   font=("Segoe UI", resp.font_size(8), "bold"),
-                                   padx=resp.scale(10), pady=resp.scale(2), bd=0, relief="flat")
-            badge_label.pack(side="right")
-            
-            footer_frame = tk.Frame(result_card, bg=COLORS["card_bg"])
-            footer_frame.pack(fill="x")
-            
-            tk.Label(footer_frame, text=f"📅 {date}", bg=COLORS["card_bg"],
-                     fg=COLORS["text_secondary"], font=("Segoe UI", resp.font_size(8))).pack(side="left")
-            
-            tk.Button(footer_frame, text="📝 Load", 
-                     command=lambda t=title, d=date: load_and_close(t, d, search_window, results_window),
-                     bg=COLORS["primary"], fg="white", font=("Segoe UI", resp.font_size(8), "bold"),
-                     padx=resp.scale(12), pady=resp.scale(3), relief="flat").pack(side="right")
+        results.update(window=results_window, content=results_content, canvas=results_canvas,
+                       header=header_label, more_btn=more_btn)
+    
+    def add_result_card(i, match):
+        title, date, badge = match["title"], match["date"], match["badge"]
+        
+        result_card = create_card(results["content"], padx=resp.scale(12), pady=resp.scale(10))
+        result_card.pack(fill="x", padx=resp.scale(5), pady=resp.scale(5))
         
-        def load_and_close(title, date, *windows):
-            load_notice_for_editing(title, date)
-            for window in windows:
-                window.destroy()
+        header_frame = tk.Frame(result_card, bg=COLORS["card_bg"])
+        header_frame.pack(fill="x", pady=(0, resp.scale(6)))
         
-        results_window.mainloop()
+        tk.Label(header_frame, text=f"{i+1}. {title}", bg=COLORS["card_bg"],
+                 fg=COLORS["dark"], font=("Segoe UI", resp.font_size(10), "bold")).pack(side="left")
+        
+        badge_lower = badge.lower().replace("🔥", "").replace("⭐", "").replace("🎉", "").replace("📌", "").strip()
+        badge_color, bg_color, text_color = BADGE_COLORS.get(badge_lower, (COLORS["warning"], COLORS["light"], COLORS["dark"]))
+        
+        badge_label = tk.Label(header_frame, text=badge,
+                               bg=bg_color, fg=text_color,
+                               font=("Segoe UI", resp.font_size(8), "bold"),
+                               padx=resp.scale(10), pady=resp.scale(2), bd=0, relief="flat")
+        badge_label.pack(side="right")
+        
+        footer_frame = tk.Frame(result_card, bg=COLORS["card_bg"])
+        footer_frame.pack(fill="x")
+        
+        tk.Label(footer_frame, text=f"📅 {date}", bg=COLORS["card_bg"],
+                 fg=COLORS["text_secondary"], font=("Segoe UI", resp.font_size(8))).pack(side="left")
+        
+        tk.Button(footer_frame, text="📝 Load", 
+                 command=lambda t=title, d=date: load_and_close(t, d),
+                 bg=COLORS["primary"], fg="white", font=("Segoe UI", resp.font_size(8), "bold"),
+                 padx=resp.scale(12), pady=resp.scale(3), relief="flat").pack(side="right")
+    
+    def show_next_page():
+        # The match read ahead to decide "Load more" opens this page
+        matches = results["matches"]
+        if results["pending"] is not None:
+            matches = itertools.chain([results["pending"]], matches)
+        page = list(itertools.islice(matches, SEARCH_PAGE_SIZE))
+        results["pending"] = next(results["matches"], None)
+        
+        for match in page:
+            add_result_card(results["shown"], match)
+            results["shown"] += 1
+        
+        more = results["pending"] is not None
+        suffix = "+" if more else ""
+        results["header"].config(text=f"🔍 Showing {results['shown']}{suffix} result(s)")
+        results["window"].title(f"Search Results ({results['shown']}{suffix} found)")
+        if more:
+            results["more_btn"].pack()
+        else:
+            results["more_btn"].pack_forget()
+    
+    def perform_search():
+        search_term = search_entry.get().strip()
+        if not search_term:
+            messagebox.showwarning("Search", "🔍 Please enter a search term")
+            return
+        
+        mode = search_var.get()
+        matches = iter_notice_matches(search_term, mode)
+        first = next(matches, None)
+        
+        if first is None:
+            messagebox.showinfo("Search Result", "📭 No matching notice found")
+            return
+        
+        if results["window"] is None or not results["window"].winfo_exists():
+            build_results_window()
+        
+        for widget in results["content"].winfo_children():
+            widget.destroy()
+        results["canvas"].yview_moveto(0)
+        results.update(matches=matches, pending=first, shown=0)
+        
+        show_next_page()
+        results["window"].deiconify()
+        results["window"].lift()
     
     button_frame = tk.Frame(content, bg=COLORS["light"])
     button_frame.pack(pady=resp.scale(15))
@@ -1282,9 +1918,115 @@ def show_search_dialog():
     
     search_entry.bind('<Return>', lambda e: perform_search())
 
+def show_schedule_dialog():
+    schedule_window = tk.Toplevel(root)
+    schedule_window.title("🕒 Scheduled Notices")
+    schedule_window.configure(bg="white")
+    schedule_window.transient(root)
+    
+    schedule_window.update_idletasks()
+    x = (root.winfo_screenwidth() // 2) - (resp.scale(600) // 2)
+    y = (root.winfo_screenheight() // 2) - (resp.scale(400) // 2)
+    schedule_window.geometry(f'{resp.scale(600)}x{resp.scale(400)}+{x}+{y}')
+    
+    header = tk.Frame(schedule_window, bg=COLORS["primary"], height=resp.scale(50))
+    header.pack(fill="x")
+    header.pack_propagate(False)
+    
+    header_label = tk.Label(header, bg=COLORS["primary"], fg="white",
+                            font=("Segoe UI", resp.font_size(12), "bold"))
+    header_label.pack(expand=True)
+    
+    container = tk.Frame(schedule_window, bg="white")
+    container.pack(fill="both", expand=True, padx=resp.scale(15), pady=resp.scale(15))
+    
+    canvas = tk.Canvas(container, bg="white", highlightthickness=0)
+    scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
+    content = tk.Frame(canvas, bg="white")
+    
+    content.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+    canvas.create_window((0, 0), window=content, anchor="nw")
+    canvas.configure(yscrollcommand=scrollbar.set)
+    
+    canvas.pack(side="left", fill="both", expand=True)
+    scrollbar.pack(side="right", fill="y")
+    
+    def edit_entry(item):
+        schedule_window.destroy()
+        if item["publish"]:
+            load_scheduled_for_editing(item["notice"], item["publish"], item["expire"])
+        else:
+            load_notice_for_editing(item["notice"]["title"], item["notice"]["date"])
+    
+    def cancel_entry(item):
+        what = "publishing" if item["publish"] else "expiry"
+        if not messagebox.askyesno("Cancel Schedule", f"🕒 Cancel the scheduled {what} of '{item['notice']['title']}'?",
+                                   parent=schedule_window):
+            return
+        if cancel_schedule(item["id"]):
+            status_label.config(text=f"🕒 Cancelled the scheduled {what} of '{item['notice']['title']}'", fg=COLORS["info"])
+            schedule_next_check()
+            populate()
+    
+    def populate():
+        for widget in content.winfo_children():
+            widget.destroy()
+        
+        items = {}
+        for entry in load_schedule():
+            item = items.setdefault(entry["id"], {"id": entry["id"], "notice": None, "publish": "", "expire": ""})
+            item[entry["action"]] = entry["at"]
+            if entry["action"] == "publish":
+                item["notice"] = entry["notice"]
+        
+        # Expiries of live notices carry no payload; take their titles from the store
+        if any(item["notice"] is None for item in items.values()):
+            result = load_table()
+            live = {row.get("data-id"): row for row in result[1].find_all("tr")} if result else {}
+            for item in items.values():
+                if item["notice"] is None and item["id"] in live:
+                    item["notice"] = row_payload(live[item["id"]])
+        items = sorted((item for item in items.values() if item["notice"]),
+                       key=lambda item: item["publish"] or item["expire"])
+        
+        header_label.config(text=f"🕒 {len(items)} scheduled notice{'s' if len(items) != 1 else ''}")
+        if not items:
+            tk.Label(content, text="📭 Nothing is scheduled", bg="white", fg=COLORS["text_secondary"],
+                     font=("Segoe UI", resp.font_size(10))).pack(pady=resp.scale(20))
+            return
+        
+        for item in items:
+            card = create_card(content, padx=resp.scale(12), pady=resp.scale(10))
+            card.pack(fill="x", padx=resp.scale(5), pady=resp.scale(5))
+            
+            tk.Label(card, text=item["notice"]["title"], bg=COLORS["card_bg"], fg=COLORS["dark"],
+                     font=("Segoe UI", resp.font_size(10), "bold"), anchor="w").pack(fill="x")
+            
+            when = []
+            if item["publish"]:
+                when.append(f"📢 Publishes {item['publish']}")
+            if item["expire"]:
+                when.append(f"⌛ Expires {item['expire']}")
+            
+            footer_frame = tk.Frame(card, bg=COLORS["card_bg"])
+            footer_frame.pack(fill="x", pady=(resp.scale(6), 0))
+            
+            tk.Label(footer_frame, text="   ".join(when), bg=COLORS["card_bg"],
+                     fg=COLORS["text_secondary"], font=("Segoe UI", resp.font_size(8))).pack(side="left")
+            
+            tk.Button(footer_frame, text="✖ Cancel", command=lambda item=item: cancel_entry(item),
+                      bg=COLORS["danger"], fg="white", font=("Segoe UI", resp.font_size(8), "bold"),
+                      padx=resp.scale(12), pady=resp.scale(3), relief="flat").pack(side="right")
+            tk.Button(footer_frame, text="📝 Edit", command=lambda item=item: edit_entry(item),
+                      bg=COLORS["primary"], fg="white", font=("Segoe UI", resp.font_size(8), "bold"),
+                      padx=resp.scale(12), pady=resp.scale(3), relief="flat").pack(side="right", padx=resp.scale(5))
+    
+    populate()
+
 def load_notice_for_editing(title, date_bs):
-    global selected_notice
+    global selected_notice, selected_notice_base, editing_scheduled
     selected_notice = (title, date_bs)
+    editing_scheduled = None
     
     result = load_table()
     if not result:
@@ -1302,6 +2044,8 @@ def load_notice_for_editing(title, date_bs):
             d = date_cell.get("data-date", "").strip()
             
             if t == title and d == date_bs:
+                selected_notice_base = (row_payload(row), loaded_table_version)
+                
                 entry_title.delete(0, tk.END)
                 entry_title.insert(0, title)
                 
@@ -1321,6 +2065,11 @@ def load_notice_for_editing(title, date_bs):
                 entry_date.delete(0, tk.END)
                 entry_date.insert(0, date_bs)
                 
+                # Live notices can only be given (or cleared of) an expiry
+                entry_publish_at.delete(0, tk.END)
+                entry_expire_at.delete(0, tk.END)
+                entry_expire_at.insert(0, scheduled_at(selected_notice_base[0]["id"], "expire"))
+                
                 download_link = row.find("a", class_="download-link")
                 if download_link:
                     file_path = download_link.get("href", "")
@@ -1341,9 +2090,36 @@ def load_notice_for_editing(title, date_bs):
                 status_label.config(text=f"📝 Editing: {title}", fg=COLORS["info"])
                 return
 
+def load_scheduled_for_editing(notice, publish_at, expire_at):
+    """Fill the form with a notice that is not published yet; Add or Edit saves it back"""
+    global editing_scheduled
+    clear_form()
+    editing_scheduled = notice
+    
+    entry_title.insert(0, notice["title"])
+    text_content.insert(tk.END, content_text(notice["content"]))
+    entry_date.insert(0, notice["date"])
+    entry_badge.delete(0, tk.END)
+    entry_badge.insert(0, notice["badge"])
+    entry_publish_at.insert(0, publish_at)
+    entry_expire_at.insert(0, expire_at)
+    
+    if notice["file_link"]:
+        file_info_label.config(text=f"📎 {os.path.basename(notice['file_link'])} (published with the notice)",
+                               fg=COLORS["success"])
+    else:
+        file_info_label.config(text="📁 No file attached", fg=COLORS["text_light"])
+    
+    status_label.config(text=f"🕒 Editing scheduled notice: {notice['title']}", fg=COLORS["info"])
+
 def edit_notice():
     global selected_notice, current_file_path
     
+    if editing_scheduled:
+        # Unpublished notices are saved back to the schedule
+        submit_notice()
+        return
+    
     if not selected_notice:
         messagebox.showwarning("Warning", "📝 Please select a notice to edit")
         return
@@ -1370,6 +2146,15 @@ def edit_notice():
         messagebox.showwarning("Input Error", "📅 Date must be in YYYY/MM/DD format")
         return
     
+    try:
+        expire_at = parse_schedule_time(entry_expire_at.get())
+    except ValueError:
+        messagebox.showwarning("Input Error", "🕒 Expire time must be in YYYY-MM-DD HH:MM format")
+        return
+    if expire_at and expire_at <= time.strftime(SCHEDULE_TIME_FORMAT):
+        messagebox.showwarning("Input Error", "🕒 Expire time must be in the future")
+        return
+    
     file_link = ""
     if current_file_path:
         file_link = save_uploaded_file(current_file_path)
@@ -1400,14 +2185,19 @@ def edit_notice():
     else:
         badge_class = "bg-yellow-100 text-yellow-800"
     
-    if update_notice_by_identifier(old_title, old_date, new_title, content, date_bs, badge, badge_class, file_link):
+    notice_id = selected_notice_base[0]["id"] if selected_notice_base else None
+    if selected_notice_base:
+        content = edited_content(content, selected_notice_base[0]["content"])
+    if update_notice_by_identifier(old_title, old_date, new_title, content, date_bs, badge, badge_class, file_link, selected_notice_base):
+        if notice_id and expire_at != scheduled_at(notice_id, "expire") and set_schedule(notice_id, expire_at):
+            schedule_next_check()
         messagebox.showinfo("Success", "✅ Notice updated successfully!")
         status_label.config(text=f"✅ Notice '{new_title}' updated successfully!", fg=COLORS["success"])
         clear_form()
         refresh_notices_list()
         update_count()
     else:
-        messagebox.showerror("Error", "❌ Failed to update notice")
+        messagebox.showerror("Error", "❌ Failed to update notice\nIt may have been changed on another workstation; refresh and try again.")
 
 def remove_notice():
     global selected_notice
@@ -1419,7 +2209,7 @@ def remove_notice():
     title, date_bs = selected_notice
     
     if messagebox.askyesno("Confirm Delete", f"🗑️ Are you sure you want to delete:\n\n'{title}'\n📅 ({date_bs})?"):
-        if delete_notice_by_identifier(title, date_bs):
+        if delete_notice_by_identifier(title, date_bs, selected_notice_base):
             messagebox.showinfo("Success", "✅ Notice deleted successfully!")
             status_label.config(text="✅ Notice deleted successfully!", fg=COLORS["success"])
             clear_form()
@@ -1648,43 +2438,76 @@ def setup_keyboard_shortcuts():
     # Ctrl+Alt+S for scaling settings
     root.bind("<Control-Alt-s>", lambda e: show_scaling_dialog())
     root.bind("<Control-Alt-S>", lambda e: show_scaling_dialog())
+    
+    # Ctrl+Alt+Z / Ctrl+Alt+Y to undo / redo notice changes
+    root.bind("<Control-Alt-z>", lambda e: undo_last_change())
+    root.bind("<Control-Alt-y>", lambda e: redo_last_change())
 
-# -------------------- Responsive UI Setup --------------------
-root = tk.Tk()
-root.title("📢 Notice Management System")
-
-# Initialize responsive configuration for main window
-resp = ResponsiveConfig(root)
-
-# Set window size for 1366x768
-window_width = resp.scale(1100)
-window_height = resp.scale(650)
-screen_width = root.winfo_screenwidth()
-screen_height = root.winfo_screenheight()
-x = (screen_width - window_width) // 2
-y = (screen_height - window_height) // 2
-root.geometry(f"{window_width}x{window_height}+{x}+{y}")
-
-# Set minimum size for 1366x768
-min_width = resp.scale(600)
-min_height = resp.scale(450)
-root.minsize(min_width, min_height)
+# -------------------- Entry Point --------------------
+def apply_schedule_cli():
+    """Headless run for cron / Task Scheduler: apply due transitions and exit"""
+    global headless
+    headless = True
+    try:
+        changes, broken_links = apply_due_schedule()
+    except TimeoutError as e:
+        print(f"Skipped: {e}", file=sys.stderr)
+        return 1
+    except OSError as e:
+        print(f"Failed: {e}", file=sys.stderr)
+        return 1
+    for kind, before, after, *_ in changes:
+        print(f"{'Published' if kind == 'insert' else 'Expired'}: {(after or before)['title']}")
+    for page, target in broken_links:
+        print(f"Broken link: {page} -> {target}")
+    pending = load_schedule()
+    print(f"{len(changes)} changes applied, {len(pending)} pending"
+          + (f" (next at {pending[0]['at']})" if pending else ""))
+    return 0
+
+if __name__ == "__main__":
+    if "--apply-schedule" in sys.argv[1:]:
+        sys.exit(apply_schedule_cli())
+    
+    # -------------------- Responsive UI Setup --------------------
+    root = tk.Tk()
+    root.title("📢 Notice Management System")
+
+    # Initialize responsive configuration for main window
+    resp = ResponsiveConfig(root)
+
+    # Set window size for 1366x768
+    window_width = resp.scale(1100)
+    window_height = resp.scale(650)
+    screen_width = root.winfo_screenwidth()
+    screen_height = root.winfo_screenheight()
+    x = (screen_width - window_width) // 2
+    y = (screen_height - window_height) // 2
+    root.geometry(f"{window_width}x{window_height}+{x}+{y}")
+
+    # Set minimum size for 1366x768
+    min_width = resp.scale(600)
+    min_height = resp.scale(450)
+    root.minsize(min_width, min_height)
+
+    root.configure(bg=COLORS["light"])
 
-root.configure(bg=COLORS["light"])
+    try:
+        root.iconbitmap("icon.ico")
+    except:
+        pass
 
-try:
-    root.iconbitmap("icon.ico")
-except:
-    pass
+    # Create main UI
+    create_main_ui()
 
-# Create main UI
-create_main_ui()
+    # Set up keyboard shortcuts
+    setup_keyboard_shortcuts()
 
-# Set up keyboard shortcuts
-setup_keyboard_shortcuts()
+    # Set focus to title field
+    entry_title.focus_set()
 
-# Set focus to title field
-entry_title.focus_set()
+    # Publish / expire anything that fell due while the app was closed, then arm the timer
+    run_due_schedule()
 
-# Start the main loop
-root.mainloop()
\ No newline at end of file
+    # Start the main loop
+    root.mainloop()
\ No newline at end of file
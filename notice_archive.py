@@ -0,0 +1,143 @@
+"""Per-year archive pages for old notices, kept free of Tk like notice_exports.
+
+Archiving only changes what is published. The notice store keeps every row,
+so staff can still find, edit, delete and undo archived notices in
+notice_admin.py. On each build, notices dated before the cutoff (and the
+oldest beyond MAX_LIVE_NOTICES) are left out of notices.json and listed on
+notice-archive-<BS year>.html instead. notices.json carries the archive
+years, from which notice.html fills its #noticeArchives links.
+
+The cutoff is the start of the BS year ARCHIVE_KEEP_YEARS before the newest
+notice, or an explicit YYYY/MM/DD date in NOTICE_ARCHIVE_BEFORE.
+"""
+import glob
+import html
+import os
+import re
+
+from notice_exports import NOTICE_STORE, load_public_notices, row_html, sort_key, write_notices_json
+from site_publish import remove_published
+
+ARCHIVE_PAGE = "notice-archive-{year}.html"
+ARCHIVE_KEEP_YEARS = 2
+MAX_LIVE_NOTICES = 300
+ARCHIVE_BEFORE_BS = os.environ.get("NOTICE_ARCHIVE_BEFORE", "").strip()
+
+ARCHIVE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8"/>
+<meta content="width=device-width, initial-scale=1.0" name="viewport"/>
+<title>Notice Archive {year} | Chautara Mavi</title>
+<link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet"/>
+<link href="https://cdn.datatables.net/1.13.4/css/jquery.dataTables.min.css" rel="stylesheet"/>
+<link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css" rel="stylesheet"/>
+<script src="https://code.jquery.com/jquery-3.6.0.min.js"></script>
+<script src="https://cdn.datatables.net/1.13.4/js/jquery.dataTables.min.js"></script>
+</head>
+<body class="bg-gray-100 font-sans min-h-screen flex flex-col">
+<header class="bg-blue-700 text-white shadow-md">
+<div class="max-w-7xl mx-auto px-4 py-4 flex justify-between items-center">
+<h1 class="text-xl sm:text-2xl font-bold">Notice Archive {year} B.S.</h1>
+<a class="px-3 py-2 hover:bg-blue-600 rounded" href="notice.html">Latest Notices</a>
+</div>
+</header>
+<main class="w-full px-4 sm:px-6 lg:px-8 py-6 flex-grow">
+<div class="w-full bg-white rounded-lg shadow overflow-hidden p-4 sm:p-6">
+<nav id="noticeArchives" class="mb-4 text-sm">{links}</nav>
+<div class="overflow-x-auto">
+<table class="display w-full" id="noticeTable">
+<thead><tr><th class="text-left">Title</th><th class="text-left">Content</th><th class="text-left">Date (BS)</th></tr></thead>
+<tbody>{rows}</tbody>
+</table>
+</div>
+</div>
+</main>
+<script>
+$(document).ready(function() {{
+  $('#noticeTable').DataTable({{ order: [[2, 'desc']], pageLength: 25, autoWidth: false }});
+}});
+</script>
+</body>
+</html>
+"""
+
+
+def archive_cutoff(records):
+    """Records whose date sorts below this number belong in the archive"""
+    if ARCHIVE_BEFORE_BS:
+        return sort_key(ARCHIVE_BEFORE_BS)
+    newest = max((record["sort"] for record in records), default=0)
+    if not newest:
+        return 0
+    return (newest // 10000 - ARCHIVE_KEEP_YEARS + 1) * 10000 + 101
+
+
+def split_notices(records):
+    """(live records, {BS year: archived records}), both newest first"""
+    records = sorted(records, key=lambda record: record["sort"], reverse=True)
+    cutoff = archive_cutoff(records)
+    live, by_year = [], {}
+    for i, record in enumerate(records):
+        if record["sort"] < cutoff or i >= MAX_LIVE_NOTICES:
+            by_year.setdefault(record["sort"] // 10000, []).append(record)
+        else:
+            live.append(record)
+    return live, by_year
+
+
+def live_notices(path=NOTICE_STORE):
+    return split_notices(load_public_notices(path))[0]
+
+
+def archive_links(years, current=None):
+    """Contents of an archive page's #noticeArchives block"""
+    if not years:
+        return ""
+    links = []
+    for year in years:
+        if year == current:
+            links.append(f"<strong>{year}</strong>")
+        else:
+            links.append(f'<a class="text-blue-600 hover:underline" href="{ARCHIVE_PAGE.format(year=year)}">{year}</a>')
+    return "📁 Older notices: " + " · ".join(links)
+
+
+def archive_page(year, records, years):
+    return ARCHIVE_TEMPLATE.format(year=html.escape(str(year)), links=archive_links(years, current=year),
+                                   rows="".join(row_html(record) for record in records))
+
+
+def archive_years_on_disk():
+    pattern = re.compile(r"notice-archive-(\d{4})\.html$")
+    years = [pattern.search(path) for path in glob.glob(ARCHIVE_PAGE.format(year="*"))]
+    return {int(match.group(1)) for match in years if match}
+
+
+def write_page(path, content):
+    """Write `content` unless the file already holds it, so unchanged pages keep their build fingerprint"""
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return True
+
+
+def write_public_notices(source=NOTICE_STORE):
+    """notices.json with the live notices and the archive pages with the rest.
+
+    Pages of years that no longer have archived notices are removed. Returns
+    the archive years.
+    """
+    live, by_year = split_notices(load_public_notices(source))
+    years = sorted(by_year, reverse=True)
+    write_notices_json(live, years)
+    for year in years:
+        write_page(ARCHIVE_PAGE.format(year=year), archive_page(year, by_year[year], years))
+    for year in archive_years_on_disk() - set(years):
+        remove_published(ARCHIVE_PAGE.format(year=year))
+    return years
@@ -0,0 +1,147 @@
+"""Public data derived from the notice store, kept free of Tk so the build can run headless.
+
+.notice_data/notice-data.html holds the admin's table of notices. It is
+committed, being the only full copy of the notices, but never published:
+GitHub Pages leaves dot folders out of the site and the publish tools skip
+it (site_publish.SKIP_FOLDERS). The public notice.html ships an empty table and loads notices.json, built
+from the store, handing it to DataTables through `ajax` with `deferRender`,
+so only the rows on screen are ever built.
+"""
+import hashlib
+import json
+import os
+from urllib.parse import quote
+
+from bs4 import BeautifulSoup
+
+NOTICE_PAGE = "notice.html"
+NOTICE_DATA_FOLDER = ".notice_data"
+NOTICE_STORE = f"{NOTICE_DATA_FOLDER}/notice-data.html"
+# Where the store lived before it moved out of the served tree
+LEGACY_NOTICE_STORE = "notice-data.html"
+NOTICES_JSON = "notices.json"
+CNAME_FILE = "CNAME"
+BADGE_ICONS = {"urgent": "🔥", "important": "⭐", "holiday": "🎉"}
+DEFAULT_BADGE_ICON = "📌"
+
+
+def site_host():
+    try:
+        with open(CNAME_FILE, "r", encoding="utf-8") as f:
+            return f.read().strip() or "localhost"
+    except OSError:
+        return "localhost"
+
+
+def site_url(path=""):
+    """Absolute URL of a site-relative path; the host comes from the CNAME file"""
+    return f"https://{site_host()}/{quote(path.lstrip('./'), safe='/')}"
+
+
+def badge_icon(badge):
+    return BADGE_ICONS.get(badge.lower(), DEFAULT_BADGE_ICON)
+
+
+def notice_rows(path=NOTICE_STORE):
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        soup = BeautifulSoup(f.read(), "html.parser")
+    tbody = soup.select_one("table#noticeTable tbody")
+    return tbody.find_all("tr") if tbody else []
+
+
+def legacy_notice_id(row):
+    """Stable ID for rows written before notices carried one, identical on every workstation"""
+    title_cell = row.find("td", {"data-label": "Title"})
+    date_cell = row.find("td", {"data-label": "Date"})
+    key = f"{title_cell.text.strip() if title_cell else ''}|{date_cell.get('data-date', '').strip() if date_cell else ''}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+
+def row_payload(row):
+    """Extract the fields needed to rebuild a row with create_row; content keeps its markup"""
+    title_cell = row.find("td", {"data-label": "Title"})
+    content_div = row.find("div", class_="notice-content")
+    date_cell = row.find("td", {"data-label": "Date"})
+    badge_span = row.find("span", class_="badge")
+    download_link = row.find("a", class_="download-link")
+
+    badge = badge_span.text.strip() if badge_span else "Normal"
+    for emoji in ["🔥", "⭐", "🎉", "📌"]:
+        badge = badge.replace(emoji, "").strip()
+
+    return {
+        "id": row.get("data-id", "") or legacy_notice_id(row),
+        "title": title_cell.text.strip() if title_cell else "",
+        "content": content_div.decode_contents().strip() if content_div else "",
+        "date": date_cell.get("data-date", "").strip() if date_cell else "",
+        "badge": badge,
+        "badge_class": " ".join(c for c in badge_span.get("class", []) if c != "badge") if badge_span else "",
+        "file_link": download_link.get("href", "") if download_link else "",
+    }
+
+
+def row_html(payload):
+    """Markup of one notice row, as kept in the notice store and shown on the archive pages"""
+    year, month, day = payload["date"].split("/")
+    sort_date = f"{year}{month.zfill(2)}{day.zfill(2)}"
+    file_link = payload["file_link"]
+    file_name = os.path.basename(file_link) if file_link else ""
+    attachment = (f"<a href='{file_link}' target='_blank' class='download-link text-blue-600'>"
+                  f"<i class='fas fa-paperclip'></i> {file_name}</a>") if file_link else ""
+    return f"""
+<tr data-id="{payload['id']}">
+<td class="font-medium text-gray-900" data-label="Title">{payload['title']}</td>
+<td class="text-gray-700" data-label="Content">
+    <div class="notice-content">{payload['content']}</div>
+    {attachment}
+    <span class="badge {payload['badge_class']}">{badge_icon(payload['badge'])} {payload['badge']}</span>
+</td>
+<td class="text-gray-600" data-label="Date" data-sort="{sort_date}" data-date="{payload['date']}">
+    <div class="font-medium"><i class="far fa-calendar-alt"></i> {payload['date']}</div>
+</td>
+</tr>
+"""
+
+
+def content_text(content):
+    """Plain text of a notice's content markup, for indexes, feeds and previews"""
+    return BeautifulSoup(content, "html.parser").get_text().strip()
+
+
+def sort_key(date_bs):
+    try:
+        year, month, day = date_bs.split("/")
+        return int(f"{year}{month.zfill(2)}{day.zfill(2)}")
+    except ValueError:
+        return 0
+
+
+def public_record(payload):
+    """row_payload plus the display fields the public table needs"""
+    record = dict(payload)
+    record["sort"] = sort_key(payload["date"])
+    record["badge_icon"] = badge_icon(payload["badge"])
+    record["has_file"] = bool(payload["file_link"])
+    record["file_name"] = os.path.basename(payload["file_link"]) if payload["file_link"] else ""
+    return record
+
+
+def load_public_notices(path=NOTICE_STORE):
+    """All notices as public records, newest first"""
+    records = [public_record(row_payload(row)) for row in notice_rows(path)]
+    return sorted(records, key=lambda record: record["sort"], reverse=True)
+
+
+def write_json_atomic(path, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        # Compact: this file is downloaded by every visitor
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def write_notices_json(notices, archive_years=(), path=NOTICES_JSON):
+    """Write the DataTables `ajax` source ({"data": [...], "archives": [BS years]})"""
+    write_json_atomic(path, {"data": notices, "archives": list(archive_years)})
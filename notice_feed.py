@@ -0,0 +1,138 @@
+"""Atom feed (notices.xml) of the most recently changed notices.
+
+notice_admin.py calls update_feed() with each change's before/after payload
+while it holds the notice lock, so only the touched entry is added, replaced
+or dropped; the feed itself (at most FEED_SIZE entries) is the only thing
+parsed. Entry IDs are derived from the notice ID and stay stable across
+edits; <updated> is the time of the last change, so pollers can tell what
+is new with a single small request. Attachments become enclosures with
+their stored size and MIME type.
+
+Full rebuild from the notice store:  python notice_feed.py
+"""
+import mimetypes
+import os
+import time
+import xml.etree.ElementTree as ET
+
+from notice_exports import NOTICE_PAGE, content_text, load_public_notices, public_record, site_host, site_url
+from notice_pages import page_path
+
+FEED_FILE = "notices.xml"
+FEED_SIZE = 30
+FEED_TITLE = "Chautara Mavi Notices"
+ATOM_NS = "http://www.w3.org/2005/Atom"
+ID_PREFIX_YEAR = 2025
+
+ET.register_namespace("", ATOM_NS)
+
+
+def atom(tag):
+    return f"{{{ATOM_NS}}}{tag}"
+
+
+def timestamp(seconds=None):
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(seconds))
+
+
+def entry_id(notice_id):
+    return f"tag:{site_host()},{ID_PREFIX_YEAR}:notice:{notice_id}"
+
+
+def entry_notice_id(entry):
+    return entry.findtext(atom("id"), "").rsplit(":", 1)[-1]
+
+
+# -------------------- Entries --------------------
+def feed_entry(record, updated, published=None):
+    """<entry> for a public notice record"""
+    entry = ET.Element(atom("entry"))
+    ET.SubElement(entry, atom("id")).text = entry_id(record["id"])
+    ET.SubElement(entry, atom("title")).text = record["title"]
+    ET.SubElement(entry, atom("updated")).text = updated
+    ET.SubElement(entry, atom("published")).text = published or updated
+    ET.SubElement(entry, atom("link"), rel="alternate", type="text/html", href=site_url(page_path(record["id"])))
+    ET.SubElement(entry, atom("category"), term=record["badge"])
+    ET.SubElement(entry, atom("content"), type="text").text = f"{content_text(record['content'])}\n\nDate (BS): {record['date']}"
+
+    file_link = record["file_link"]
+    if file_link and os.path.exists(file_link):
+        ET.SubElement(entry, atom("link"), {
+            "rel": "enclosure",
+            "href": site_url(file_link),
+            "length": str(os.path.getsize(file_link)),
+            "type": mimetypes.guess_type(file_link)[0] or "application/octet-stream",
+            "title": record["file_name"],
+        })
+    return entry
+
+
+def load_feed_entries(path=FEED_FILE):
+    """Entries of the current feed, or None when there is no readable feed yet"""
+    if not os.path.exists(path):
+        return None
+    try:
+        return ET.parse(path).getroot().findall(atom("entry"))
+    except ET.ParseError:
+        return None
+
+
+def write_feed(entries, path=FEED_FILE):
+    entries = sorted(entries, key=lambda entry: entry.findtext(atom("updated"), ""), reverse=True)[:FEED_SIZE]
+    feed = ET.Element(atom("feed"))
+    ET.SubElement(feed, atom("id")).text = entry_id("feed")
+    ET.SubElement(feed, atom("title")).text = FEED_TITLE
+    ET.SubElement(feed, atom("updated")).text = (
+        entries[0].findtext(atom("updated")) if entries else timestamp())
+    ET.SubElement(feed, atom("link"), rel="self", type="application/atom+xml", href=site_url(path))
+    ET.SubElement(feed, atom("link"), rel="alternate", type="text/html", href=site_url(NOTICE_PAGE))
+    feed.extend(entries)
+
+    tmp_path = path + ".tmp"
+    ET.ElementTree(feed).write(tmp_path, encoding="utf-8", xml_declaration=True)
+    os.replace(tmp_path, path)
+
+
+# -------------------- Updating --------------------
+def rebuild_feed(notices=None, path=FEED_FILE):
+    """Feed of the newest-dated notices; every entry gets the current time"""
+    notices = load_public_notices() if notices is None else notices
+    now = timestamp()
+    # Equal timestamps: the stable sort in write_feed keeps the newest dates first
+    write_feed([feed_entry(record, now) for record in notices[:FEED_SIZE]], path)
+
+
+def update_feed(before, after, live_notices, path=FEED_FILE):
+    """Apply one notice change (payloads as in the operation log) to the feed.
+
+    `live_notices` is a callable returning the remaining notices' payloads;
+    it is only called when the feed is missing or a delete left it short and
+    the gap is refilled with the newest-dated notices not already listed.
+    """
+    entries = load_feed_entries(path)
+    if entries is None:
+        rebuild_feed(sorted((public_record(p) for p in live_notices()),
+                            key=lambda record: record["sort"], reverse=True), path)
+        return
+
+    touched = {p["id"] for p in (before, after) if p}
+    previous = {entry_notice_id(entry): entry for entry in entries}
+    entries = [entry for entry in entries if entry_notice_id(entry) not in touched]
+
+    if after:
+        old_entry = previous.get(after["id"]) if before else None
+        published = old_entry.findtext(atom("published")) if old_entry is not None else None
+        entries.append(feed_entry(public_record(after), timestamp(), published))
+    elif len(entries) < FEED_SIZE:
+        listed = {entry_notice_id(entry) for entry in entries}
+        oldest = min((entry.findtext(atom("updated"), "") for entry in entries), default=timestamp())
+        candidates = sorted((public_record(p) for p in live_notices() if p["id"] not in listed),
+                            key=lambda record: record["sort"], reverse=True)
+        # Backfilled entries are not news, so they sort after everything already listed
+        entries += [feed_entry(record, oldest) for record in candidates[:FEED_SIZE - len(entries)]]
+    write_feed(entries, path)
+
+
+if __name__ == "__main__":
+    rebuild_feed()
+    print(f"Wrote {FEED_FILE} for {site_host()}")
@@ -0,0 +1,180 @@
+"""Static permalink page per notice (notice-pages/<id>.html) plus an index.
+
+Each page is a few KB of self-contained HTML (no Tailwind or DataTables)
+with Open Graph tags, so a shared link previews and loads quickly.
+notice_admin.py calls update_notice_pages() with each change's before/after
+payload: only the touched notice's page is written or removed, and its
+single <li> in notice-pages/index.html is patched in place. Pages of
+archived notices are left alone, so shared links keep working.
+
+Full rebuild from the notice store:  python notice_pages.py
+"""
+import html
+import os
+from urllib.parse import quote
+
+from bs4 import BeautifulSoup
+
+from notice_exports import content_text, load_public_notices, public_record, site_url
+from site_publish import remove_published, serialize_html
+
+PAGES_FOLDER = "notice-pages"
+PAGE_INDEX = f"{PAGES_FOLDER}/index.html"
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".webp")
+
+PAGE_STYLE = """
+body { margin: 0; font-family: "Segoe UI", Arial, sans-serif; background: #f3f4f6; color: #111827; }
+header { background: #1d4ed8; color: #fff; padding: 14px 20px; }
+header a { color: #fff; text-decoration: none; font-weight: 600; }
+main { max-width: 760px; margin: 24px auto; background: #fff; border-radius: 8px; padding: 24px; box-shadow: 0 1px 3px rgba(0,0,0,.1); }
+h1 { font-size: 1.5rem; margin: 0 0 8px; }
+.meta { color: #4b5563; font-size: .9rem; margin-bottom: 16px; }
+.badge { padding: 2px 10px; border-radius: 20px; font-size: 12px; font-weight: bold; margin-left: 8px; }
+.bg-red-100 { background: #fee2e2; } .text-red-800 { color: #991b1b; }
+.bg-blue-100 { background: #dbeafe; } .text-blue-800 { color: #1e40af; }
+.bg-green-100 { background: #d1fae5; } .text-green-800 { color: #065f46; }
+.bg-yellow-100 { background: #fef3c7; } .text-yellow-800 { color: #92400e; }
+.content { white-space: pre-line; line-height: 1.6; }
+.attachment { margin-top: 20px; }
+.attachment img { max-width: 100%; height: auto; border: 1px solid #e5e7eb; border-radius: 4px; }
+ul { padding-left: 20px; line-height: 1.9; }
+a { color: #2563eb; }
+"""
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8"/>
+<meta content="width=device-width, initial-scale=1.0" name="viewport"/>
+<title>{title} | Chautara Mavi</title>
+<meta content="{description}" name="description"/>
+<meta content="{title}" property="og:title"/>
+<meta content="{description}" property="og:description"/>
+<meta content="article" property="og:type"/>
+{og_url}{og_image}<style>{style}</style>
+</head>
+<body>
+<header><a href="../notice.html">← All Notices</a></header>
+<main>
+{body}
+</main>
+</body>
+</html>
+"""
+
+
+def page_path(notice_id):
+    # Also used in URLs, so always "/" rather than os.sep
+    return f"{PAGES_FOLDER}/{notice_id}.html"
+
+
+def page_href(path):
+    """Link from a page in PAGES_FOLDER to a site-relative file"""
+    return "../" + quote(path.lstrip("./"), safe="/")
+
+
+# -------------------- Rendering --------------------
+def render_notice_page(record):
+    """Permalink page for a public notice record"""
+    title = html.escape(record["title"])
+    description = html.escape(" ".join(content_text(record["content"]).split())[:200])
+    file_link = record["file_link"]
+    is_image = file_link.lower().endswith(IMAGE_EXTENSIONS)
+
+    body = [
+        f"<h1>{title}</h1>",
+        f'<div class="meta">📅 {html.escape(record["date"])} B.S.'
+        f'<span class="badge {html.escape(record["badge_class"])}">'
+        f'{html.escape(record["badge_icon"])} {html.escape(record["badge"])}</span></div>',
+        f'<div class="content">{record["content"]}</div>',
+    ]
+    if file_link:
+        href = page_href(file_link)
+        preview = f'<img alt="{title}" loading="lazy" src="{href}"/><br/>' if is_image else ""
+        body.append(f'<div class="attachment">{preview}<a href="{href}" target="_blank">'
+                    f'📎 {html.escape(record["file_name"])}</a></div>')
+
+    og_url = f'<meta content="{site_url(page_path(record["id"]))}" property="og:url"/>\n'
+    og_image = f'<meta content="{site_url(file_link)}" property="og:image"/>\n' if is_image else ""
+    return PAGE_TEMPLATE.format(title=title, description=description, og_url=og_url, og_image=og_image,
+                                style=PAGE_STYLE, body="\n".join(body))
+
+
+def write_page(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+# -------------------- Index --------------------
+def load_index():
+    if os.path.exists(PAGE_INDEX):
+        with open(PAGE_INDEX, "r", encoding="utf-8") as f:
+            return BeautifulSoup(f.read(), "html.parser")
+    body = '<h1>Notices</h1>\n<ul id="noticePages"></ul>'
+    return BeautifulSoup(PAGE_TEMPLATE.format(
+        title="Notices", description="All notices of Chautara Mavi", og_url="", og_image="",
+        style=PAGE_STYLE, body=body), "html.parser")
+
+
+def index_item(soup, record):
+    item = soup.new_tag("li", attrs={"data-id": record["id"], "data-sort": str(record["sort"])})
+    link = soup.new_tag("a", href=f"{quote(record['id'])}.html")
+    link.string = record["title"]
+    item.append(link)
+    item.append(f" — {record['date']}")
+    return item
+
+
+def patch_index(soup, removed_id=None, record=None):
+    """Drop `removed_id`'s entry and/or insert `record`'s, keeping newest dates first"""
+    listing = soup.find(id="noticePages")
+    for notice_id in {removed_id, record and record["id"]} - {None}:
+        for item in listing.find_all("li", attrs={"data-id": notice_id}):
+            item.decompose()
+    if record:
+        item = index_item(soup, record)
+        later = next((li for li in listing.find_all("li")
+                      if int(li.get("data-sort", 0)) <= record["sort"]), None)
+        if later is not None:
+            later.insert_before(item)
+        else:
+            listing.append(item)
+
+
+# -------------------- Updating --------------------
+def update_notice_pages(before, after):
+    """Apply one notice change (payloads as in the operation log)"""
+    record = public_record(after) if after else None
+    if before and not after:
+        remove_published(page_path(before["id"]))
+    if record:
+        write_page(page_path(record["id"]), render_notice_page(record))
+
+    soup = load_index()
+    patch_index(soup, before["id"] if before else None, record)
+    write_page(PAGE_INDEX, serialize_html(soup))
+
+
+def rebuild_notice_pages():
+    """Write and list the page of every notice in the store, archived ones included.
+
+    Index entries whose page no longer exists are dropped.
+    """
+    records = load_public_notices()
+    soup = load_index()
+    for item in soup.find(id="noticePages").find_all("li"):
+        if not os.path.exists(page_path(item.get("data-id", ""))):
+            item.decompose()
+    for record in records:
+        write_page(page_path(record["id"]), render_notice_page(record))
+        patch_index(soup, record=record)
+    write_page(PAGE_INDEX, serialize_html(soup))
+    return records
+
+
+if __name__ == "__main__":
+    records = rebuild_notice_pages()
+    print(f"Wrote {len(records)} notice pages to {PAGES_FOLDER}/")
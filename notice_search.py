@@ -0,0 +1,100 @@
+"""Prebuilt token index for searching notices in the browser.
+
+notice.html downloads notice-search.json the first time the search box gets
+focus and answers each keystroke from it: every query term is matched as a
+prefix against the sorted token list, the postings of the matching tokens
+are unioned per term and intersected across terms, and DataTables is told to
+show only those notice IDs. Nothing is re-scanned per keystroke.
+
+The index covers the live (not archived) notices' title, content, badge,
+date and attachment name, plus the text of PDF attachments when the pypdf
+package is installed. Attachment tokens are cached by mtime/size so a
+rebuild after one new notice only opens that notice's file. site_build.py rebuilds the index whenever the notice
+store changes.
+
+Usage:  python notice_search.py
+"""
+import os
+import re
+import unicodedata
+
+from notice_archive import live_notices
+from notice_exports import content_text, write_json_atomic
+from site_publish import PUBLISH_STATE_FOLDER, load_json, manifest_key, save_json
+
+try:
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
+
+SEARCH_INDEX = "notice-search.json"
+ATTACHMENT_CACHE = os.path.join(PUBLISH_STATE_FOLDER, "search-attachments.json")
+INDEX_VERSION = 1
+MAX_ATTACHMENT_PAGES = 20
+# Split on whitespace and punctuation only, so Devanagari vowel signs stay in
+# their words; notice.html tokenizes queries with the same character class
+TOKEN_PATTERN = re.compile(r"[^\s.,;:!?()\[\]{}\"'`/\\|<>«»“”‘’–—।॥-]+")
+
+
+# -------------------- Tokenizing --------------------
+def tokenize(text):
+    text = unicodedata.normalize("NFC", text or "").lower()
+    return set(TOKEN_PATTERN.findall(text))
+
+
+def attachment_tokens(path, cache):
+    """Tokens of a PDF attachment's text, reused from `cache` while mtime and size are unchanged"""
+    if PdfReader is None or not path.lower().endswith(".pdf"):
+        return set()
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return set()
+    key = manifest_key(path)
+    cached = cache.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return set(cached[2])
+
+    tokens = set()
+    try:
+        reader = PdfReader(path)
+        for page in reader.pages[:MAX_ATTACHMENT_PAGES]:
+            tokens |= tokenize(page.extract_text() or "")
+    except Exception as e:
+        print(f"Could not read {path} for the search index: {e}")
+    cache[key] = [stat.st_mtime_ns, stat.st_size, sorted(tokens)]
+    return tokens
+
+
+# -------------------- Index --------------------
+def build_search_index(notices, cache=None):
+    """{"v", "ids", "tokens": {token: [positions in ids]}} for public notice records"""
+    cache = {} if cache is None else cache
+    ids, postings = [], {}
+    for record in notices:
+        position = len(ids)
+        ids.append(record["id"])
+        fields = (record["title"], content_text(record["content"]), record["badge"], record["date"],
+                  record["file_name"])
+        tokens = set().union(*(tokenize(field) for field in fields))
+        if record["file_link"]:
+            tokens |= attachment_tokens(record["file_link"], cache)
+        for token in tokens:
+            postings.setdefault(token, []).append(position)
+    return {"v": INDEX_VERSION, "ids": ids,
+            "tokens": {token: postings[token] for token in sorted(postings)}}
+
+
+def write_search_index(path=SEARCH_INDEX):
+    cache = load_json(ATTACHMENT_CACHE, {})
+    index = build_search_index(live_notices(), cache)
+    write_json_atomic(path, index)
+    live = {manifest_key(p) for p in cache if os.path.exists(p)}
+    save_json(ATTACHMENT_CACHE, {k: v for k, v in cache.items() if k in live})
+    return index
+
+
+if __name__ == "__main__":
+    index = write_search_index()
+    print(f"{SEARCH_INDEX}: {len(index['ids'])} notices, {len(index['tokens'])} tokens"
+          + ("" if PdfReader else " (install pypdf to index PDF attachments)"))
@@ -0,0 +1,140 @@
+"""Delta publish: bundle only what changed since the last upload.
+
+Keeps a content-hash manifest of the tree as it was last published. Each run
+compares the current tree against it and writes
+.publish/bundles/delta-<timestamp>.zip with the added and changed files,
+plus a deletion list (inside the zip as DELETED.txt and next to it).
+Files whose mtime and size match the stat cache are not re-hashed, and the
+rest are hashed on a thread pool, so a publish after one new notice ships
+kilobytes.
+
+Usage:  python publish_delta.py             build the bundle and record it as published
+        python publish_delta.py --dry-run   only list what would be shipped
+"""
+import fnmatch
+import hashlib
+import os
+import sys
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from site_publish import PUBLISH_STATE_FOLDER, SKIP_FOLDERS, load_json, manifest_key, save_json
+
+DEPLOY_MANIFEST = os.path.join(PUBLISH_STATE_FOLDER, "deploy-manifest.json")
+BUNDLE_FOLDER = os.path.join(PUBLISH_STATE_FOLDER, "bundles")
+# Admin tooling and local state never go to the web host
+DEPLOY_EXCLUDE = ("*.py", "*.pyc", "*.tmp", "*.lock", "*.jsonl", "*.patch", ".gitignore", "README.md", "READ-ME.txt")
+# Already compressed; deflating them again only costs time
+STORED_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".webp", ".mp4", ".pdf", ".gz", ".br", ".zip", ".ico", ".woff", ".woff2")
+
+
+# -------------------- Scanning --------------------
+def deploy_files(root="."):
+    for folder, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in SKIP_FOLDERS]
+        for name in files:
+            if not any(fnmatch.fnmatch(name, pattern) for pattern in DEPLOY_EXCLUDE):
+                yield manifest_key(os.path.relpath(os.path.join(folder, name), root))
+
+
+def hash_file(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return path, digest.hexdigest()
+
+
+def scan_tree(stat_cache, workers=8):
+    """Current {path: sha256}, hashing only files whose mtime/size changed.
+
+    Returns the hashes and the refreshed stat cache.
+    """
+    hashes, fresh_cache, to_hash = {}, {}, []
+    for path in deploy_files("."):
+        stat = os.stat(path)
+        cached = stat_cache.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            hashes[path] = cached[2]
+            fresh_cache[path] = cached
+        else:
+            to_hash.append((path, stat))
+
+    # hashlib releases the GIL on large buffers, so threads hash in parallel
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for (path, stat), (_, digest) in zip(to_hash, pool.map(hash_file, [p for p, _ in to_hash])):
+            hashes[path] = digest
+            fresh_cache[path] = [stat.st_mtime_ns, stat.st_size, digest]
+    return hashes, fresh_cache
+
+
+def diff_trees(deployed, current):
+    added = sorted(p for p in current if p not in deployed)
+    changed = sorted(p for p in current if p in deployed and deployed[p] != current[p])
+    removed = sorted(p for p in deployed if p not in current)
+    return added, changed, removed
+
+
+# -------------------- Bundling --------------------
+def write_bundle(paths, removed, stamp):
+    os.makedirs(BUNDLE_FOLDER, exist_ok=True)
+    bundle_path = os.path.join(BUNDLE_FOLDER, f"delta-{stamp}.zip")
+    deleted_path = os.path.join(BUNDLE_FOLDER, f"delta-{stamp}-deleted.txt")
+    deletion_list = "".join(f"{path}\n" for path in removed)
+
+    tmp_path = bundle_path + ".tmp"
+    with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED, compresslevel=6) as bundle:
+        for path in paths:
+            stored = path.lower().endswith(STORED_EXTENSIONS)
+            bundle.write(path, path, compress_type=zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED)
+        if removed:
+            bundle.writestr("DELETED.txt", deletion_list)
+    os.replace(tmp_path, bundle_path)
+
+    if removed:
+        with open(deleted_path, "w", encoding="utf-8") as f:
+            f.write(deletion_list)
+    return bundle_path, deleted_path if removed else None
+
+
+def publish_delta(root=".", dry_run=False):
+    """Compute the delta since the last publish and bundle it.
+
+    Returns (added, changed, removed, bundle path or None). The manifest is
+    only advanced when a bundle was written, so a failed or dry run can be
+    repeated safely.
+    """
+    previous_cwd = os.getcwd()
+    os.chdir(root)
+    try:
+        state = load_json(DEPLOY_MANIFEST, {})
+        current, stat_cache = scan_tree(state.get("stat", {}))
+        added, changed, removed = diff_trees(state.get("deployed", {}), current)
+
+        bundle_path = None
+        if not dry_run and (added or changed or removed):
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            bundle_path, _ = write_bundle(added + changed, removed, stamp)
+            state["deployed"] = current
+            state["last_bundle"] = manifest_key(bundle_path)
+        state["stat"] = stat_cache
+        save_json(DEPLOY_MANIFEST, state)
+        return added, changed, removed, bundle_path
+    finally:
+        os.chdir(previous_cwd)
+
+
+if __name__ == "__main__":
+    dry_run = "--dry-run" in sys.argv[1:]
+    added, changed, removed, bundle_path = publish_delta(dry_run=dry_run)
+    for label, paths in (("+", added), ("~", changed), ("-", removed)):
+        for path in paths:
+            print(f"{label} {path}")
+    print(f"{len(added)} added, {len(changed)} changed, {len(removed)} removed")
+    if bundle_path:
+        print(f"Upload {bundle_path} ({os.path.getsize(bundle_path) / 1024:.1f} KB)")
+        if removed:
+            print("then delete the files listed in its DELETED.txt from the host")
+    elif not dry_run:
+        print("Nothing to publish")
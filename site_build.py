@@ -0,0 +1,227 @@
+"""Incremental build of the files derived from the admin tools' pages.
+
+Each target names its input files, its outputs and the action that makes
+them. A target is rebuilt only when an input's content hash differs from the
+one recorded after its last build, or an output is missing. Targets run in
+registration order, so a target registered after another sees its fresh
+outputs. State (target fingerprints plus a stat cache that avoids re-hashing
+untouched files) lives in .publish/build-state.json, so restarts stay
+incremental.
+
+notice_admin.py and banner_manager.py call run_site_build() after every
+save. Full pass:  python site_build.py [--force]
+"""
+import glob
+import hashlib
+import os
+import re
+import sys
+
+from bs4 import BeautifulSoup
+
+from notice_archive import write_public_notices
+from notice_exports import NOTICE_STORE, NOTICES_JSON
+from notice_feed import FEED_FILE
+from notice_pages import PAGES_FOLDER
+from notice_search import SEARCH_INDEX, write_search_index
+from site_publish import IMAGE_MANIFEST, PUBLISH_STATE_FOLDER, load_json, manifest_key, precompress, save_json
+
+BUILD_STATE = os.path.join(PUBLISH_STATE_FOLDER, "build-state.json")
+NOTICE_PAGE = "notice.html"
+BANNER_PAGE = "banner.html"
+INDEX_PAGE = "index.html"
+ARCHIVE_PAGES = "notice-archive-*.html"
+NOTICE_PAGES = os.path.join(PAGES_FOLDER, "*.html")
+
+
+# -------------------- Build Graph --------------------
+class BuildError(Exception):
+    """Raised by BuildGraph.build() after a pass in which some targets failed"""
+
+    def __init__(self, failed):
+        self.failed = failed
+        super().__init__("; ".join(f"{name}: {error}" for name, error in failed))
+
+
+class BuildGraph:
+
+    def __init__(self, state_path=BUILD_STATE):
+        self.state_path = state_path
+        self.targets = []
+        self.file_hashes = {}
+
+    def target(self, name, inputs, outputs, action):
+        """Register a target; `inputs`/`outputs` are path lists or callables returning them"""
+        self.targets.append((name, inputs, outputs, action))
+
+    def fingerprint(self, path):
+        """Content hash of a file, reusing the cached one while mtime and size are unchanged"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = manifest_key(path)
+        cached = self.file_hashes.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        self.file_hashes[key] = [stat.st_mtime_ns, stat.st_size, digest.hexdigest()]
+        return digest.hexdigest()
+
+    def build(self, force=False):
+        """Rebuild out-of-date targets and return their names.
+
+        A failing action does not stop the pass; the other targets still run
+        and BuildError lists every failure once the state is saved.
+        """
+        state = load_json(self.state_path, {})
+        self.file_hashes = state.get("files", {})
+        built = state.get("targets", {})
+        rebuilt, failed = [], []
+
+        for name, inputs, outputs, action in self.targets:
+            input_paths = inputs() if callable(inputs) else inputs
+            output_paths = outputs() if callable(outputs) else outputs
+            fingerprints = {manifest_key(p): self.fingerprint(p) for p in input_paths}
+
+            previous = built.get(name)
+            if (not force and previous and previous["inputs"] == fingerprints
+                    and all(os.path.exists(p) for p in output_paths)):
+                continue
+
+            try:
+                action()
+            except Exception as e:
+                print(f"Build target {name} failed: {e}")
+                built.pop(name, None)
+                failed.append((name, e))
+                continue
+
+            # Re-read inputs: an action may rewrite one of them (index.html is both)
+            built[name] = {"inputs": {manifest_key(p): self.fingerprint(p) for p in input_paths},
+                           "outputs": [manifest_key(p) for p in output_paths]}
+            rebuilt.append(name)
+
+        live = {manifest_key(p) for p in self.file_hashes if os.path.exists(p)}
+        save_json(self.state_path, {
+            "files": {k: v for k, v in self.file_hashes.items() if k in live},
+            "targets": built,
+        })
+        if failed:
+            raise BuildError(failed)
+        return rebuilt
+
+
+def write_page(path, content):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+# -------------------- Banner Inlining --------------------
+def replace_between(content, start_marker, end_marker, replacement, indent=""):
+    pattern = re.compile(re.escape(start_marker) + r".*?" + re.escape(end_marker), re.DOTALL)
+    if not pattern.search(content):
+        return None
+    body = f"\n{indent}{replacement}" if replacement else ""
+    return pattern.sub(lambda m: f"{start_marker}{body}\n{indent}{end_marker}", content, count=1)
+
+
+def banner_preload(banner_html):
+    """<link rel="preload"> for the first slide's image or video poster, or "" """
+    if banner_html.lstrip().startswith("<!-- Banner Disabled"):
+        return ""
+    first = BeautifulSoup(banner_html, "html.parser").select_one("div.slide")
+    if first is None:
+        return ""
+
+    webp = first.select_one('picture source[type="image/webp"]')
+    img = first.find("img")
+    video = first.find("video")
+    if webp is not None and webp.get("srcset"):
+        return (f'<link rel="preload" as="image" type="image/webp" '
+                f'imagesrcset="{webp["srcset"]}" imagesizes="{webp.get("sizes", "")}">')
+    if img is not None and img.get("src"):
+        srcset = (f' imagesrcset="{img["srcset"]}" imagesizes="{img.get("sizes", "")}"'
+                  if img.get("srcset") else "")
+        return f'<link rel="preload" as="image" href="{img["src"]}"{srcset}>'
+    if video is not None and video.get("poster"):
+        return f'<link rel="preload" as="image" href="{video["poster"]}">'
+    return ""
+
+
+def inlined_index(banner_html, index_html):
+    """index.html with the rendered banner inlined into #banner-container.
+
+    The markup (including its <script> tag) is placed between the Banner
+    Inline markers and the preload hint between the Banner Preload markers.
+    The runtime fetch of banner.html stays in index.html as the fallback
+    for pages without the data-inlined flag. Returns None when index.html
+    has no markers.
+    """
+    container = f'<div id="banner-container" data-inlined>\n{banner_html.strip()}\n</div>'
+    content = replace_between(
+        index_html, "<!-- Banner Inline Start -->", "<!-- Banner Inline End -->", container)
+    if content is None:
+        return None
+    return replace_between(
+        content, "<!-- Banner Preload Start -->", "<!-- Banner Preload End -->",
+        banner_preload(banner_html), indent="    ") or content
+
+
+def inline_banner(banner_page=BANNER_PAGE, index_page=INDEX_PAGE):
+    with open(banner_page, "r", encoding="utf-8") as f:
+        banner_html = f.read()
+    # Imported here: image_optimizer needs Pillow, which the notice admin does not
+    try:
+        from image_optimizer import optimized_sources, rewrite_html
+    except ImportError:
+        pass
+    else:
+        banner_html = rewrite_html(banner_html, optimized_sources())
+    with open(index_page, "r", encoding="utf-8") as f:
+        index_html = f.read()
+
+    content = inlined_index(banner_html, index_html)
+    if content is None:
+        print(f"{index_page} has no Banner Inline markers; leaving it to fetch {banner_page}")
+    elif content != index_html:
+        write_page(index_page, content)
+
+
+# -------------------- Site Targets --------------------
+def site_graph():
+    """The site's derived files, registered producers first"""
+    graph = BuildGraph()
+
+    if os.path.exists(NOTICE_STORE):
+        graph.target("public-notices", [NOTICE_STORE], [NOTICES_JSON], write_public_notices)
+        graph.target("search-index", [NOTICE_STORE], [SEARCH_INDEX], write_search_index)
+
+    if os.path.exists(BANNER_PAGE) and os.path.exists(INDEX_PAGE):
+        graph.target("inline-banner", [BANNER_PAGE, INDEX_PAGE, IMAGE_MANIFEST], [INDEX_PAGE], inline_banner)
+
+    pages = (NOTICE_PAGE, NOTICES_JSON, SEARCH_INDEX, FEED_FILE, BANNER_PAGE, INDEX_PAGE,
+             *sorted(glob.glob(ARCHIVE_PAGES)), *sorted(glob.glob(NOTICE_PAGES)))
+    for page in pages:
+        if os.path.exists(page):
+            graph.target(f"precompress:{page}", [page], [page + ".gz"],
+                         lambda page=page: precompress([page]))
+    return graph
+
+
+def run_site_build(force=False):
+    """Bring every derived file up to date; cheap when nothing changed"""
+    return site_graph().build(force=force)
+
+
+if __name__ == "__main__":
+    try:
+        rebuilt = run_site_build(force="--force" in sys.argv[1:])
+    except BuildError as e:
+        sys.exit(f"Failed targets: {', '.join(name for name, _ in e.failed)}")
+    print(f"Rebuilt {len(rebuilt)} targets" + (f": {', '.join(rebuilt)}" if rebuilt else ""))
@@ -0,0 +1,220 @@
+"""Publish stage shared by notice_admin.py and banner_manager.py.
+
+Writes precompressed .gz (and .br when the brotli package is installed)
+siblings next to generated pages and static assets so the host can serve
+them directly. A content-hash manifest keeps re-runs incremental.
+
+Generated pages are written compact by default; set SITE_READABLE_HTML=1
+to get indented, diff-friendly output while debugging.
+
+Full-site pass:  python site_publish.py
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from bs4 import BeautifulSoup, NavigableString
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+PUBLISH_STATE_FOLDER = ".publish"
+COMPRESS_MANIFEST = os.path.join(PUBLISH_STATE_FOLDER, "compress-manifest.json")
+# Written by image_optimizer; kept here so the build can depend on it without Pillow
+IMAGE_MANIFEST = os.path.join(PUBLISH_STATE_FOLDER, "image-manifest.json")
+COMPRESSIBLE_EXTENSIONS = (".html", ".css", ".js", ".json", ".xml", ".svg", ".txt")
+SKIP_FOLDERS = {".git", ".publish", ".notice_admin", ".notice_data", ".banner_cache", ".pytest_cache", "__pycache__",
+                "scss", "tests"}
+READABLE_HTML = os.environ.get("SITE_READABLE_HTML") == "1"
+
+# Whitespace inside these is significant (or is code) and is left untouched
+PRESERVE_WHITESPACE_TAGS = {"pre", "textarea", "script", "style"}
+# Whitespace at the edge of these never renders, so it can be dropped entirely
+BLOCK_TAGS = {
+    "html", "head", "body", "title", "meta", "link", "script", "style", "base",
+    "div", "p", "main", "header", "footer", "nav", "section", "article", "aside",
+    "h1", "h2", "h3", "h4", "h5", "h6", "ul", "ol", "li", "dl", "dt", "dd",
+    "table", "thead", "tbody", "tfoot", "tr", "td", "th", "caption", "colgroup", "col",
+    "form", "fieldset", "legend", "hr", "br", "option", "figure", "figcaption",
+}
+# ASCII whitespace as HTML defines it; unlike \s this excludes U+00A0 (&nbsp;)
+HTML_WHITESPACE = " \t\n\r\f"
+HTML_WHITESPACE_RUN = re.compile(f"[{HTML_WHITESPACE}]+")
+
+
+# -------------------- Manifest --------------------
+def load_json(path, default):
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except ValueError:
+        return default
+
+
+def save_json(path, data):
+    """Write JSON atomically so a crash never leaves a half-written manifest"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1, sort_keys=True, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def manifest_key(path):
+    return os.path.normpath(path).replace("\\", "/")
+
+
+# -------------------- HTML Serialization --------------------
+def _is_block_edge(node, parent):
+    if node is None:
+        return parent is None or parent.name in BLOCK_TAGS or parent.name == "[document]"
+    return getattr(node, "name", None) in BLOCK_TAGS
+
+
+def compact_soup(soup):
+    """Collapse insignificant whitespace in place.
+
+    Runs of HTML whitespace become a single space, and whitespace touching a
+    block-level boundary is removed. Non-breaking spaces (&nbsp;) are not
+    HTML whitespace and stay. Comments, doctype and the contents of <pre>,
+    <textarea>, <script> and <style> are left exactly as they were.
+    """
+    for text in list(soup.find_all(string=True)):
+        if type(text) is not NavigableString:
+            continue
+        if any(parent.name in PRESERVE_WHITESPACE_TAGS for parent in text.parents):
+            continue
+
+        collapsed = HTML_WHITESPACE_RUN.sub(" ", str(text))
+        if _is_block_edge(text.previous_sibling, text.parent):
+            collapsed = collapsed.lstrip(HTML_WHITESPACE)
+        if _is_block_edge(text.next_sibling, text.parent):
+            collapsed = collapsed.rstrip(HTML_WHITESPACE)
+
+        if not collapsed:
+            text.extract()
+        elif collapsed != text:
+            text.replace_with(collapsed)
+    return soup
+
+
+def serialize_html(soup, readable=None):
+    """Serialize a page for publishing: compact by default, indented in readable mode"""
+    if readable is None:
+        readable = READABLE_HTML
+    if readable:
+        return soup.prettify()
+    return str(compact_soup(soup))
+
+
+def minify_html(html):
+    return serialize_html(BeautifulSoup(html, "html.parser"), readable=False)
+
+
+# -------------------- Compression --------------------
+def compressed_variants(path):
+    variants = [path + ".gz"]
+    if brotli is not None:
+        variants.append(path + ".br")
+    return variants
+
+
+def compress_file(path, previous_hash=None):
+    """Compress one file unless its hash matches `previous_hash` and the variants exist.
+
+    Returns (path, content hash, whether anything was written).
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+
+    if digest == previous_hash and all(os.path.exists(p) for p in compressed_variants(path)):
+        return path, digest, False
+
+    # mtime=0 keeps the .gz byte-identical for identical input
+    with open(path + ".gz", "wb") as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(path + ".br", "wb") as f:
+            f.write(brotli.compress(data, quality=11))
+    return path, digest, True
+
+
+def precompress(paths, workers=None):
+    """Precompress the given files, skipping those unchanged since the last run.
+
+    With `workers` > 1 the files are compressed in a process pool; callers
+    running inside a GUI should leave it at None and pass only the files
+    they just wrote.
+    """
+    manifest = load_json(COMPRESS_MANIFEST, {})
+    paths = [p for p in paths if os.path.isfile(p)]
+    jobs = [(p, manifest.get(manifest_key(p))) for p in paths]
+
+    if workers and workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(compress_file, *zip(*jobs), chunksize=8))
+    else:
+        results = [compress_file(path, previous) for path, previous in jobs]
+
+    written = 0
+    for path, digest, changed in results:
+        if changed or manifest.get(manifest_key(path)) != digest:
+            manifest[manifest_key(path)] = digest
+            written += 1
+    if written:
+        save_json(COMPRESS_MANIFEST, manifest)
+    return written
+
+
+def remove_published(path):
+    """Delete a generated file together with its precompressed variants"""
+    for variant in (path, path + ".gz", path + ".br"):
+        try:
+            os.remove(variant)
+        except FileNotFoundError:
+            pass
+
+
+def site_files(root=".", extensions=COMPRESSIBLE_EXTENSIONS):
+    for folder, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in SKIP_FOLDERS]
+        for name in files:
+            if name.lower().endswith(extensions):
+                yield os.path.relpath(os.path.join(folder, name), root)
+
+
+def precompress_site(root="."):
+    """Full-site pass: compress every text asset across all cores and drop stale variants"""
+    previous_cwd = os.getcwd()
+    os.chdir(root)
+    try:
+        paths = list(site_files("."))
+        written = precompress(paths, workers=os.cpu_count())
+
+        manifest = load_json(COMPRESS_MANIFEST, {})
+        live = {manifest_key(p) for p in paths}
+        for key in [k for k in manifest if k not in live]:
+            for variant in (key + ".gz", key + ".br"):
+                if os.path.exists(variant):
+                    os.remove(variant)
+            del manifest[key]
+        save_json(COMPRESS_MANIFEST, manifest)
+        return len(paths), written
+    finally:
+        os.chdir(previous_cwd)
+
+
+if __name__ == "__main__":
+    total, written = precompress_site(sys.argv[1] if len(sys.argv) > 1 else ".")
+    print(f"Precompressed {written} of {total} files")
+    if brotli is None:
+        print("brotli is not installed; only .gz variants were written (pip install brotli)")
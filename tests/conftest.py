@@ -0,0 +1,37 @@
+import os
+import sys
+
+import pytest
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import notice_admin  # noqa: E402
+from site_publish import serialize_html  # noqa: E402
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    """Run in an empty site folder"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def write_store(site):
+    """Write a notice store holding the given payloads, in order"""
+    def write(payloads):
+        soup = BeautifulSoup(notice_admin.STORE_TEMPLATE, "html.parser")
+        tbody = soup.find("tbody")
+        for p in payloads:
+            tbody.append(notice_admin.create_row(p["title"], p["content"], p["date"], p["badge"],
+                                                 p["badge_class"], p["file_link"], p["id"]))
+        os.makedirs(os.path.dirname(notice_admin.HTML_FILE), exist_ok=True)
+        with open(notice_admin.HTML_FILE, "w", encoding="utf-8") as f:
+            f.write(serialize_html(soup))
+    return write
+
+
+def payload(notice_id, title, date="2082/01/01", content="Body", badge="Normal", file_link=""):
+    return {"id": notice_id, "title": title, "content": content, "date": date, "badge": badge,
+            "badge_class": "bg-yellow-100 text-yellow-800", "file_link": file_link}
@@ -0,0 +1,60 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+import banner_manager
+
+
+def slide(kind, file, caption, poster=""):
+    return {"type": kind, "file": file, "caption": caption, "poster": poster}
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_generated_banner_imports_back_into_the_manifest(site, enabled):
+    slides = [
+        slide("image", "front.jpg", 'Admissions "open" & more'),
+        slide("image", "second.png", "Sports <day>"),
+        slide("video", "tour.mp4", "Campus tour", poster="posters/tour.jpg"),
+    ]
+    manager = SimpleNamespace(banner_enabled=enabled, slides=slides)
+    (site / "banner.html").write_text(banner_manager.BannerManager.render_html(manager, {}), encoding="utf-8")
+
+    imported_enabled, imported = banner_manager.import_banner_html("banner.html")
+    assert imported_enabled == enabled
+    assert imported == slides
+
+    banner_manager.save_manifest(imported_enabled, imported, "banner.json")
+    loaded_enabled, loaded = banner_manager.load_manifest("banner.json")
+    assert loaded_enabled == enabled
+    assert [{key: s[key] for key in ("type", "file", "caption", "poster")} for s in loaded] == slides
+
+
+def test_ingest_reuses_identical_media(site):
+    (site / "banner" / "banner_img").mkdir(parents=True)
+    (site / "upload").mkdir()
+    (site / "upload" / "clip.mp4").write_bytes(b"first video")
+    (site / "upload" / "copy of clip.mp4").write_bytes(b"first video")
+
+    name, sha256, reused = banner_manager.ingest_media(str(site / "upload" / "clip.mp4"))
+    assert (name, reused) == ("clip.mp4", False)
+    assert banner_manager.ingest_media(str(site / "upload" / "copy of clip.mp4")) == ("clip.mp4", sha256, True)
+
+    # Same name, other content: stored next to the first under a numbered name
+    (site / "upload" / "clip.mp4").write_bytes(b"second video")
+    assert banner_manager.ingest_media(str(site / "upload" / "clip.mp4"))[::2] == ("clip-1.mp4", False)
+    assert sorted(p.name for p in (site / "banner" / "banner_img").iterdir()) == ["clip-1.mp4", "clip.mp4"]
+
+
+def test_media_hashes_rehash_only_changed_files(site, monkeypatch):
+    (site / "banner" / "banner_img").mkdir(parents=True)
+    (site / "banner" / "banner_img" / "a.mp4").write_bytes(b"a")
+    (site / "banner" / "banner_img" / "b.mp4").write_bytes(b"b")
+    assert sorted(banner_manager.media_hashes().values()) == ["a.mp4", "b.mp4"]
+
+    hashed = []
+    real_sha256 = banner_manager.file_sha256
+    monkeypatch.setattr(banner_manager, "file_sha256", lambda path: hashed.append(path) or real_sha256(path))
+    (site / "banner" / "banner_img" / "b.mp4").write_bytes(b"bb")
+    assert sorted(banner_manager.media_hashes().values()) == ["a.mp4", "b.mp4"]
+    assert [os.path.basename(path) for path in hashed] == ["b.mp4"]
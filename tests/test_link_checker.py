@@ -0,0 +1,17 @@
+import json
+
+from link_checker import new_broken_links
+
+
+def test_new_broken_links_reports_each_break_once(site):
+    (site / "notices").mkdir()
+    (site / "notices" / "a.pdf").write_bytes(b"%PDF")
+    (site / "notices.json").write_text(json.dumps({"data": [{"file_link": "notices/a.pdf"}]}))
+    (site / "old.html").write_text('<a href="gone.pdf">old</a>')
+    assert new_broken_links() == []  # first run: the old break is the baseline
+
+    (site / "notices" / "a.pdf").unlink()
+    assert new_broken_links() == [("notices.json", "notices/a.pdf")]
+    assert new_broken_links() == []
+
+    assert new_broken_links(pending={"new.html": '<img src="missing.png">'}) == [("new.html", "missing.png")]
@@ -0,0 +1,179 @@
+import itertools
+import os
+
+import pytest
+
+import notice_admin
+from conftest import payload
+
+
+def titles(matches):
+    return [match["title"] for match in matches]
+
+
+def test_match_rank():
+    assert notice_admin._match_rank("Exam", "exam") == 0
+    assert notice_admin._match_rank("Exam Routine", "exam") == 1
+    assert notice_admin._match_rank("Final Exam", "exam") == 2
+    assert notice_admin._match_rank("Reexam", "exam") == 3
+    assert notice_admin._match_rank("Holiday", "exam") is None
+
+
+def test_matches_rank_then_newest_first(write_store):
+    write_store([
+        payload("a", "Reexam notice", "2082/05/01"),
+        payload("b", "Exam", "2082/01/01"),
+        payload("c", "Exam routine", "2082/02/01"),
+        payload("d", "Final exam", "2082/03/01"),
+        payload("e", "Exam schedule", "2082/04/01"),
+        payload("f", "Holiday", "2082/06/01"),
+    ])
+    assert titles(notice_admin.iter_notice_matches("exam")) == [
+        "Exam", "Exam schedule", "Exam routine", "Final exam", "Reexam notice"]
+
+
+def test_matches_by_date_and_badge(write_store):
+    write_store([
+        payload("a", "One", "2082/01/01", badge="Urgent"),
+        payload("b", "Two", "2081/01/01", badge="Holiday"),
+    ])
+    assert titles(notice_admin.iter_notice_matches("2081", "date")) == ["Two"]
+    assert titles(notice_admin.iter_notice_matches("urgent", "badge")) == ["One"]
+
+
+def test_matches_page_lazily(write_store):
+    size = notice_admin.SEARCH_PAGE_SIZE
+    write_store([payload(f"n{i}", f"Notice {i}", f"2082/01/{i + 1:02d}") for i in range(size + 5)])
+    matches = notice_admin.iter_notice_matches("notice")
+    first_page = list(itertools.islice(matches, size))
+    assert len(first_page) == size
+    assert first_page[0]["title"] == f"Notice {size + 4}"
+    assert len(list(matches)) == 5
+
+
+def test_oplog_compaction_keeps_recent_steps_and_cursor(site, monkeypatch):
+    monkeypatch.setattr(notice_admin, "MAX_UNDO_STEPS", 3)
+    monkeypatch.setattr(notice_admin, "OPLOG_COMPACT_LINES", 6)
+    log = notice_admin.OperationLog(".notice_admin/oplog-test.jsonl")
+    for i in range(6):
+        log.record("insert", None, payload(f"n{i}", f"Notice {i}"), 0)
+    log.mark("undo")
+
+    # The seventh line triggered compaction down to the last three steps, one undone
+    assert [entry["after"]["id"] for entry in log.entries] == ["n3", "n4", "n5"]
+    assert log.peek_redo()["after"]["id"] == "n5"
+    assert log.peek_undo()["after"]["id"] == "n4"
+
+    reloaded = notice_admin.OperationLog(log.path)
+    reloaded.load()
+    assert reloaded.entries == log.entries
+    assert reloaded.cursor == log.cursor == 2
+    assert reloaded.line_count == 4
+
+
+def test_oplog_compaction_purges_unreferenced_trash(site, monkeypatch):
+    monkeypatch.setattr(notice_admin, "MAX_UNDO_STEPS", 1)
+    trash = site / notice_admin.TRASH_FOLDER
+    trash.mkdir(parents=True)
+    (trash / "old.pdf").write_text("old")
+    (trash / "kept.pdf").write_text("kept")
+
+    log = notice_admin.OperationLog(".notice_admin/oplog-test.jsonl")
+    log.record("delete", payload("a", "A", file_link="notices/old.pdf"), None, 0)
+    log.record("delete", payload("b", "B", file_link="notices/kept.pdf"), None, 0)
+    log.compact()
+
+    assert sorted(p.name for p in trash.iterdir()) == ["kept.pdf"]
+
+
+def test_parse_schedule_time():
+    assert notice_admin.parse_schedule_time("") == ""
+    assert notice_admin.parse_schedule_time("  ") == ""
+    assert notice_admin.parse_schedule_time("2026-10-19 9:05") == "2026-10-19 09:05"
+    assert notice_admin.parse_schedule_time(" 2026-10-19 ") == "2026-10-19 00:00"
+
+
+@pytest.mark.parametrize("text", ["2026/10/19", "19-10-2026 10:00", "2026-13-01", "tomorrow"])
+def test_parse_schedule_time_rejects_other_formats(text):
+    with pytest.raises(ValueError):
+        notice_admin.parse_schedule_time(text)
+
+
+def test_save_checks_links_against_the_rebuilt_outputs(write_store, site):
+    (site / "notices").mkdir()
+    (site / "notices" / "a.pdf").write_bytes(b"%PDF")
+    write_store([payload("a", "One", file_link="notices/a.pdf"), payload("b", "Two")])
+    soup, tbody = notice_admin.load_table()
+    assert notice_admin.save_table(soup) == []
+
+    # Deleting the notice and its file must not flag the notices.json entry it leaves behind
+    tbody.find("tr", attrs={"data-id": "a"}).decompose()
+    (site / "notices" / "a.pdf").unlink()
+    assert notice_admin.save_table(soup) == []
+    assert "notices/a.pdf" not in (site / "notices.json").read_text()
+
+
+def test_outputs_are_patched_only_after_the_store_is_written(write_store, monkeypatch):
+    write_store([payload("a", "One")])
+    patched = []
+    monkeypatch.setattr(notice_admin, "headless", True)
+    monkeypatch.setattr(notice_admin, "update_notice_outputs", lambda tbody, before, after: patched.append(after))
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as m:
+        m.setattr(notice_admin.os, "replace", fail_replace)
+        assert notice_admin.commit_notice_change("insert", None, payload("b", "Two"), 0, record=False) is None
+    assert patched == []
+
+    assert notice_admin.commit_notice_change("insert", None, payload("b", "Two"), 0, record=False) == 0
+    assert [after["id"] for after in patched] == ["b"]
+
+
+def test_unchanged_content_keeps_its_markup():
+    stored = "<b>Ledger</b> for 2nd &amp; 4th"
+    assert notice_admin.edited_content("Ledger for 2nd & 4th", stored) == stored
+    assert notice_admin.edited_content("Ledger for 3rd", stored) == "Ledger for 3rd"
+
+
+def test_lock_breaks_a_stale_lock_only(site):
+    lock_path = str(site / "store.lock")
+    with open(lock_path, "w") as f:
+        f.write("crashed 1")
+    os.utime(lock_path, (0, 0))
+    with notice_admin.NoticeFileLock(lock_path, timeout=1):
+        assert open(lock_path).read() != "crashed 1"
+        with pytest.raises(TimeoutError):
+            with notice_admin.NoticeFileLock(lock_path, timeout=0.2):
+                pass
+    assert os.listdir(site) == []
+
+
+@pytest.fixture
+def headless(monkeypatch):
+    monkeypatch.setattr(notice_admin, "headless", True)
+    monkeypatch.setattr(notice_admin, "warn_broken_links", lambda broken_links: None)
+
+
+def test_commit_merges_onto_a_store_changed_elsewhere(write_store, headless):
+    write_store([payload("a", "One"), payload("b", "Two")])
+    before, version = notice_admin.resolve_notice("One", "2082/01/01")
+
+    # Another workstation edits a different notice
+    assert notice_admin.commit_notice_change("update", payload("b", "Two"), payload("b", "Two v2"), record=False) == 1
+
+    after = dict(before, title="One v2")
+    assert notice_admin.commit_notice_change("update", before, after, base_version=version, record=False) == 0
+    assert [notice["title"] for notice in map(notice_admin.row_payload, notice_admin.notice_rows())] == [
+        "One v2", "Two v2"]
+
+
+def test_commit_refuses_a_notice_edited_elsewhere(write_store, headless):
+    write_store([payload("a", "One")])
+    before, version = notice_admin.resolve_notice("One", "2082/01/01")
+    assert notice_admin.commit_notice_change("update", before, dict(before, title="Theirs"), record=False) == 0
+
+    assert notice_admin.commit_notice_change(
+        "update", before, dict(before, title="Mine"), base_version=version, record=False) is None
+    assert [notice["title"] for notice in map(notice_admin.row_payload, notice_admin.notice_rows())] == ["Theirs"]
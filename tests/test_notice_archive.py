@@ -0,0 +1,41 @@
+import json
+
+import notice_archive
+from conftest import payload
+
+
+def record(notice_id, sort):
+    return {"id": notice_id, "sort": sort}
+
+
+def ids(records):
+    return [r["id"] for r in records]
+
+
+def test_split_archives_older_years_by_year():
+    live, by_year = notice_archive.split_notices([
+        record("old", 20790315), record("new", 20820505), record("last-year", 20811230),
+        record("older", 20800101), record("old-2", 20791201),
+    ])
+    assert ids(live) == ["new", "last-year"]
+    assert {year: ids(records) for year, records in by_year.items()} == {2080: ["older"], 2079: ["old-2", "old"]}
+
+
+def test_split_moves_the_oldest_beyond_the_live_limit(monkeypatch):
+    monkeypatch.setattr(notice_archive, "MAX_LIVE_NOTICES", 2)
+    live, by_year = notice_archive.split_notices([
+        record("a", 20820301), record("b", 20820201), record("c", 20820101)])
+    assert ids(live) == ["a", "b"]
+    assert {year: ids(records) for year, records in by_year.items()} == {2082: ["c"]}
+
+
+def test_write_public_notices_pages_each_archive_year(write_store, site):
+    (site / "notice-archive-2070.html").write_text("gone")
+    (site / "notice-archive-2070.html.gz").write_bytes(b"gone")
+    write_store([payload("a", "New", "2082/05/01"), payload("b", "Old", "2079/02/01")])
+
+    assert notice_archive.write_public_notices() == [2079]
+    data = json.loads((site / "notices.json").read_text(encoding="utf-8"))
+    assert (ids(data["data"]), data["archives"]) == (["a"], [2079])
+    assert 'data-id="b"' in (site / "notice-archive-2079.html").read_text(encoding="utf-8")
+    assert sorted(p.name for p in site.glob("notice-archive-*")) == ["notice-archive-2079.html"]
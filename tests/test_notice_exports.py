@@ -0,0 +1,25 @@
+import json
+
+from bs4 import BeautifulSoup
+
+from conftest import payload
+from notice_archive import write_public_notices
+from notice_exports import NOTICES_JSON, notice_rows, row_html, row_payload
+
+
+def test_notices_json_round_trips_the_rows(write_store):
+    write_store([
+        payload("a", "Exam & result", "2082/03/05", content="<b>Ledger</b> for 2nd &amp; 4th", file_link="notices/a.pdf"),
+        payload("b", "Holiday", "2082/02/01", badge="Holiday"),
+    ])
+    stored = {p["id"]: p for p in map(row_payload, notice_rows())}
+
+    write_public_notices()
+    with open(NOTICES_JSON, "r", encoding="utf-8") as f:
+        records = json.load(f)["data"]
+
+    assert [record["id"] for record in records] == ["a", "b"]
+    for record in records:
+        assert {key: record[key] for key in stored[record["id"]]} == stored[record["id"]]
+        rebuilt = BeautifulSoup(row_html(record), "html.parser").tr
+        assert row_payload(rebuilt) == stored[record["id"]]
@@ -0,0 +1,52 @@
+import itertools
+
+import notice_feed
+from conftest import payload
+from notice_feed import FEED_FILE, atom, entry_notice_id, load_feed_entries, update_feed
+
+
+def feed_ids():
+    return [entry_notice_id(entry) for entry in load_feed_entries(FEED_FILE)]
+
+
+def entry_for(notice_id):
+    return next(entry for entry in load_feed_entries(FEED_FILE) if entry_notice_id(entry) == notice_id)
+
+
+def test_missing_feed_is_rebuilt_from_live_notices(site):
+    live = [payload("a", "Old", "2082/01/01"), payload("b", "New", "2082/02/01")]
+    update_feed(None, live[0], lambda: live)
+    assert feed_ids() == ["b", "a"]
+
+
+def test_insert_update_and_delete(site, monkeypatch):
+    days = itertools.count(1)
+    monkeypatch.setattr(notice_feed, "timestamp", lambda seconds=None: f"2026-01-{next(days):02d}T00:00:00Z")
+    notice_feed.write_feed([])
+
+    first, second = payload("a", "First"), payload("b", "Second")
+    update_feed(None, first, lambda: [first])
+    update_feed(None, second, lambda: [first, second])
+    assert feed_ids() == ["b", "a"]
+
+    edited = dict(first, title="First (edited)")
+    update_feed(first, edited, lambda: [edited, second])
+    assert feed_ids() == ["a", "b"]
+    entry = entry_for("a")
+    assert entry.findtext(atom("title")) == "First (edited)"
+    assert entry.findtext(atom("updated")) == "2026-01-04T00:00:00Z"
+    # The entry keeps its original publication time
+    assert entry.findtext(atom("published")) == "2026-01-02T00:00:00Z"
+
+    update_feed(second, None, lambda: [edited])
+    assert feed_ids() == ["a"]
+
+
+def test_delete_backfills_a_full_feed(site, monkeypatch):
+    monkeypatch.setattr(notice_feed, "FEED_SIZE", 2)
+    notices = [payload(n, n.upper(), f"2082/01/0{i + 1}") for i, n in enumerate("abc")]
+    notice_feed.rebuild_feed([notice_feed.public_record(p) for p in notices[1:]])
+    assert sorted(feed_ids()) == ["b", "c"]
+
+    update_feed(notices[2], None, lambda: notices[:2])
+    assert sorted(feed_ids()) == ["a", "b"]
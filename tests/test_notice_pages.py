@@ -0,0 +1,32 @@
+from conftest import payload
+from notice_exports import public_record
+from notice_pages import load_index, page_path, patch_index
+
+
+def listed(soup):
+    return [item["data-id"] for item in soup.find(id="noticePages").find_all("li")]
+
+
+def test_page_path_uses_forward_slashes():
+    assert page_path("abc") == "notice-pages/abc.html"
+
+
+def test_patch_index_keeps_newest_dates_first(site):
+    soup = load_index()
+    for notice_id, date in (("b", "2082/02/01"), ("a", "2082/01/01"), ("c", "2082/03/01")):
+        patch_index(soup, record=public_record(payload(notice_id, notice_id.upper(), date)))
+    assert listed(soup) == ["c", "b", "a"]
+
+
+def test_patch_index_replaces_and_removes(site):
+    soup = load_index()
+    for notice_id, date in (("a", "2082/01/01"), ("b", "2082/02/01")):
+        patch_index(soup, record=public_record(payload(notice_id, notice_id.upper(), date)))
+
+    # An edit that moves the date re-sorts the single entry
+    patch_index(soup, "a", public_record(payload("a", "A (moved)", "2082/03/01")))
+    assert listed(soup) == ["a", "b"]
+    assert soup.find("li", attrs={"data-id": "a"}).a.string == "A (moved)"
+
+    patch_index(soup, removed_id="b")
+    assert listed(soup) == ["a"]
@@ -0,0 +1,32 @@
+from conftest import payload
+from notice_exports import public_record
+from notice_search import INDEX_VERSION, build_search_index, tokenize
+
+
+def test_tokenize_lowercases_and_splits_on_punctuation():
+    assert tokenize("Exam-Routine, 2082/01/05!") == {"exam", "routine", "2082", "01", "05"}
+    assert tokenize("परीक्षा तालिका।") == {"परीक्षा", "तालिका"}
+
+
+def test_build_search_index():
+    notices = [
+        public_record(payload("a", "Exam Routine", "2082/01/05", content="<b>First</b> term", badge="Urgent")),
+        public_record(payload("b", "Holiday", "2082/02/01", content="Exam break")),
+    ]
+    index = build_search_index(notices)
+
+    assert index["v"] == INDEX_VERSION
+    assert index["ids"] == ["a", "b"]
+    assert list(index["tokens"]) == sorted(index["tokens"])
+    assert index["tokens"]["exam"] == [0, 1]
+    assert index["tokens"]["urgent"] == [0]
+    assert index["tokens"]["holiday"] == [1]
+    # Content markup is indexed by its text
+    assert index["tokens"]["first"] == [0]
+    assert "b" not in index["tokens"]
+
+
+def test_build_search_index_indexes_attachment_names():
+    record = public_record(payload("a", "Result", file_link="notices/Ledger_2082.pdf"))
+    index = build_search_index([record], cache={})
+    assert index["tokens"]["ledger_2082"] == [0]
@@ -0,0 +1,50 @@
+import zipfile
+
+import publish_delta
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_deploy_files_leave_out_tooling_and_local_state(site):
+    for name in ("index.html", "css/site.css", "notice_admin.py", "REVIEW_DIFF.patch", "requests.jsonl",
+                 "tests/test_x.py", ".pytest_cache/v/cache", ".notice_data/notice-data.html",
+                 "__pycache__/x.pyc", ".publish/build-state.json"):
+        write(site / name, "x")
+    assert sorted(publish_delta.deploy_files(".")) == ["css/site.css", "index.html"]
+
+
+def test_delta_bundles_only_what_changed(site):
+    write(site / "index.html", "home")
+    write(site / "about.html", "about")
+    write(site / "old.html", "old")
+    assert publish_delta.publish_delta(dry_run=True)[:3] == (["about.html", "index.html", "old.html"], [], [])
+    first = publish_delta.publish_delta()
+    assert first[0] == ["about.html", "index.html", "old.html"] and first[3]
+
+    write(site / "index.html", "home v2")
+    write(site / "new.html", "new")
+    (site / "old.html").unlink()
+    added, changed, removed, bundle_path = publish_delta.publish_delta()
+    assert (added, changed, removed) == (["new.html"], ["index.html"], ["old.html"])
+    with zipfile.ZipFile(bundle_path) as bundle:
+        assert sorted(bundle.namelist()) == ["DELETED.txt", "index.html", "new.html"]
+        assert bundle.read("DELETED.txt") == b"old.html\n"
+
+    assert publish_delta.publish_delta()[:4] == ([], [], [], None)
+
+
+def test_scan_tree_rehashes_only_changed_files(site, monkeypatch):
+    write(site / "a.html", "a")
+    write(site / "b.html", "b")
+    hashes, cache = publish_delta.scan_tree({})
+
+    hashed = []
+    real_hash_file = publish_delta.hash_file
+    monkeypatch.setattr(publish_delta, "hash_file", lambda path: hashed.append(path) or real_hash_file(path))
+    write(site / "b.html", "bb")
+    new_hashes, _ = publish_delta.scan_tree(cache)
+    assert hashed == ["b.html"]
+    assert new_hashes["a.html"] == hashes["a.html"] and new_hashes["b.html"] != hashes["b.html"]
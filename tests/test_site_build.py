@@ -0,0 +1,25 @@
+import pytest
+
+from site_build import BuildError, BuildGraph
+
+
+def test_build_runs_every_target_and_reports_failures(site):
+    (site / "in.txt").write_text("input")
+    ran = []
+
+    def fail():
+        raise ValueError("boom")
+
+    graph = BuildGraph(state_path="state.json")
+    graph.target("broken", ["in.txt"], ["broken.out"], fail)
+    graph.target("ok", ["in.txt"], [], lambda: ran.append("ok"))
+
+    with pytest.raises(BuildError) as error:
+        graph.build()
+    assert [name for name, _ in error.value.failed] == ["broken"]
+    assert ran == ["ok"]
+
+    # The failed target is retried next time; the one that succeeded is not
+    with pytest.raises(BuildError):
+        graph.build()
+    assert ran == ["ok"]
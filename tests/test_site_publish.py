@@ -0,0 +1,51 @@
+import gzip
+import hashlib
+
+import pytest
+
+from site_publish import (COMPRESS_MANIFEST, compressed_variants, load_json, minify_html, precompress,
+                          precompress_site)
+
+
+@pytest.mark.parametrize("html, expected", [
+    ("<p>\n  a   b\t</p>", "<p>a b</p>"),
+    ("<p>a&nbsp;&nbsp;b</p>", "<p>a\xa0\xa0b</p>"),
+    ("<p>&nbsp;</p>", "<p>\xa0</p>"),
+    ("<td> &nbsp;x&nbsp; </td>", "<td>\xa0x\xa0</td>"),
+    ("<p>a <b>b</b> c</p>", "<p>a <b>b</b> c</p>"),
+    ("<pre> a\n  b </pre>", "<pre> a\n  b </pre>"),
+])
+def test_minify_html_collapses_only_html_whitespace(html, expected):
+    assert minify_html(html) == expected
+
+
+def compressed_names(folder):
+    return sorted(p.name for p in folder.iterdir() if p.suffix in (".gz", ".br"))
+
+
+def test_precompress_skips_unchanged_files(site):
+    (site / "a.html").write_text("<p>a</p>")
+    (site / "b.css").write_text("p{}")
+    assert precompress(["a.html", "b.css", "missing.js"]) == 2
+    assert gzip.decompress((site / "a.html.gz").read_bytes()) == b"<p>a</p>"
+    assert load_json(COMPRESS_MANIFEST, {})["a.html"] == hashlib.sha256(b"<p>a</p>").hexdigest()
+
+    assert precompress(["a.html", "b.css"]) == 0
+    (site / "a.html").write_text("<p>changed</p>")
+    (site / "b.css.gz").unlink()
+    assert precompress(["a.html", "b.css"]) == 2
+    assert gzip.decompress((site / "a.html.gz").read_bytes()) == b"<p>changed</p>"
+
+
+def test_precompress_site_drops_variants_of_removed_files(site):
+    (site / "keep.html").write_text("keep")
+    (site / "gone.html").write_text("gone")
+    (site / "tests").mkdir()
+    (site / "tests" / "page.html").write_text("test")
+    assert precompress_site() == (2, 2)
+
+    (site / "gone.html").unlink()
+    assert precompress_site() == (1, 0)
+    assert set(load_json(COMPRESS_MANIFEST, {})) == {"keep.html"}
+    assert compressed_names(site) == sorted(compressed_variants("keep.html"))
+    assert compressed_names(site / "tests") == []